@@ -0,0 +1,185 @@
+"""Memory and allocation benchmark of the container info/stats records.
+
+Runs the real stats collection of DockerContainerAPI for 500 containers:
+the parsing of a Docker stats frame into the ContainerStats record, and the
+notify snapshot of the ContainerInfo/ContainerStats records. The frames are
+those of the fake daemon (see fake_docker.py), without the HTTP request.
+The containers are inspected first, so the network counters are parsed too.
+
+Side by side, the same values are put in the nested dictionaries which were
+built on every poll before the records, with the notify comparison of the
+merged dictionaries. Both layouts are read like the sensors do.
+
+Run from the repository root (requires the Home Assistant requirements):
+
+    python -m benchmarks.bench_records
+"""
+
+import asyncio
+import gc
+import random
+import time
+import tracemalloc
+
+from benchmarks.fake_docker import FakeContainer
+
+CONTAINERS = 500
+POLLS = 20
+
+
+class StatsSource:
+    """The container of aiodocker, backed by a fake container."""
+
+    def __init__(self, fake: FakeContainer):
+        self._fake = fake
+        self._container = fake.list_entry()
+        self.id = fake.id
+
+    async def stats(self, stream: bool = False) -> list[dict]:
+        return [self._fake.stats()]
+
+
+class DictLayout:
+    """The info/stats as nested dictionaries, rebuilt every poll."""
+
+    def __init__(self, container):
+        self._container = container
+        self.info: dict = {}
+        self.stats: dict = {}
+        self.snapshot: dict = {}
+
+    def poll(self) -> set:
+        # The values of the real collection, in the old layout
+        info = dict(self._container.get_info().items())
+        values = self._container.get_stats()
+
+        stats = {}
+        stats["cpu"] = {"total": values.cpu_percentage, "online_cpus": 4}
+        stats["memory"] = {
+            "usage": values.memory,
+            "limit": 16384.0,
+            "usage_percent": values.memory_percentage,
+        }
+        stats["network"] = {
+            "total_tx": values.network_total_up,
+            "total_rx": values.network_total_down,
+            "speed_tx": values.network_speed_up,
+            "speed_rx": values.network_speed_down,
+        }
+        stats["disk"] = {"read": None, "write": None}
+        stats.update(values.items())
+
+        self.info = info
+        self.stats = stats
+
+        snapshot = {**self.info, **self.stats}
+        changed = {
+            key
+            for key in snapshot.keys() | self.snapshot.keys()
+            if snapshot.get(key) != self.snapshot.get(key)
+        }
+        self.snapshot = snapshot
+        return changed
+
+    def read(self, keys: tuple) -> list:
+        return [self.info.get(key, self.stats.get(key)) for key in keys]
+
+
+class RecordLayout:
+    """The info/stats records of the container, updated in place."""
+
+    def __init__(self, container):
+        self._container = container
+
+    def poll(self) -> None:
+        self._container._notify()
+
+    def read(self, keys: tuple) -> list:
+        info = self._container.get_info()
+        stats = self._container.get_stats()
+        return [info.get(key, stats.get(key)) for key in keys]
+
+
+async def collect(containers: list) -> None:
+    for container in containers:
+        await container._run_container_stats()
+
+
+def measure(layouts: list, keys: tuple) -> tuple[float, int]:
+    """Return the time per container and the transient peak memory of a
+    build and read of the layout.
+    """
+
+    tracemalloc.start()
+    for layout in layouts:
+        layout.poll()
+        layout.read(keys)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(POLLS):
+        for layout in layouts:
+            layout.poll()
+            layout.read(keys)
+    duration = (time.perf_counter() - start) / (POLLS * len(layouts))
+
+    return duration, peak - current
+
+
+async def run() -> None:
+    # Imported here, so the import itself is not measured
+    from custom_components.monitor_docker import DOCKER_SCHEMA
+    from custom_components.monitor_docker.helpers import (
+        _SNAPSHOT_KEYS,
+        DockerContainerAPI,
+    )
+
+    random.seed(1)
+    config = DOCKER_SCHEMA({"name": "Bench"})
+
+    gc.collect()
+    tracemalloc.start()
+    containers = []
+    for idx in range(CONTAINERS):
+        fake = FakeContainer(idx)
+        container = DockerContainerAPI(config, None, f"container-{idx}")
+        container.attach(StatsSource(fake))
+        container._set_inspect(fake.inspect())
+        container._update_info()
+        containers.append(container)
+
+    # The first poll has no CPU/network reference, the second fills all values
+    await collect(containers)
+    await collect(containers)
+    for container in containers:
+        container._notify()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(POLLS):
+        await collect(containers)
+    parse = (time.perf_counter() - start) / (POLLS * CONTAINERS)
+
+    print(
+        f"{CONTAINERS} containers, records retained {retained / 1024:.1f} kB,"
+        f" stats parsing {parse * 1e6:.2f} us/poll"
+    )
+
+    for name, cls in [("dicts", DictLayout), ("records", RecordLayout)]:
+        layouts = [cls(container) for container in containers]
+        gc.collect()
+        duration, peak = measure(layouts, _SNAPSHOT_KEYS)
+        print(
+            f"  {name:8} {duration * 1e6:7.2f} us/poll build+notify+read,"
+            f" transient peak {peak / 1024:8.1f} kB"
+        )
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Throughput benchmark of the collection against the fake Docker Engine API.
+
+For every number of containers a fake daemon (see fake_docker.py) and the
+benchmark run in their own process, so the CPU time and memory measured
+are only those of Monitor Docker. Per cycle it reports the requests sent
+to the daemon, the poll cycle duration and the CPU time of the process,
+including the executor threads.
+
+Run from the repository root (requires the Home Assistant requirements):
+
+    python -m benchmarks.bench_throughput
+    python -m benchmarks.bench_throughput --containers 100 --latency 0.005 --churn 2
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+from unittest import mock
+
+from aiohttp import ClientSession, UnixConnector
+
+from benchmarks.fake_docker import serve
+
+INTERVAL = 2
+CYCLES = 5
+
+
+class BenchHass:
+    """The parts of Home Assistant used by DockerAPI."""
+
+    class bus:
+        @staticmethod
+        def async_listen_once(*args) -> None:
+            pass
+
+    async def async_add_executor_job(self, target, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+
+async def fetch_requests(socket: str) -> Counter:
+    """Request counters of the fake daemon."""
+    async with ClientSession(connector=UnixConnector(path=socket)) as session:
+        async with session.get("http://localhost/_bench/requests") as response:
+            return Counter(await response.json())
+
+
+async def shutdown(api) -> None:
+    """Stop all tasks of the DockerAPI, like a stop of Home Assistant."""
+    await api._monitor_stop(None)
+
+
+async def measure(socket: str, interval: int, cycles: int) -> dict[str, Any]:
+    # Imported here, the daemon process does not need Home Assistant
+    from custom_components.monitor_docker import DOCKER_SCHEMA, helpers
+    from custom_components.monitor_docker.const import ATTR_POLL_CYCLE_DURATION
+
+    config = DOCKER_SCHEMA(
+        {"name": "Bench", "url": f"unix://{socket}", "scan_interval": interval}
+    )
+    api = helpers.DockerAPI(BenchHass(), config)
+
+    # No entities, we only measure the collection
+    startup = time.perf_counter()
+    with mock.patch.object(helpers, "load_platform"):
+        await api.init()
+    startup = time.perf_counter() - startup
+
+    # Warm-up, the first cycle inspects all containers
+    await asyncio.sleep(interval)
+
+    before = await fetch_requests(socket)
+    wall = time.perf_counter()
+    cpu = time.process_time()
+
+    durations = []
+    for _ in range(cycles):
+        await asyncio.sleep(interval)
+        durations.append(api.get_info().get(ATTR_POLL_CYCLE_DURATION) or 0.0)
+
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+    requests = await fetch_requests(socket) - before
+
+    await shutdown(api)
+
+    return {
+        "startup": startup,
+        "requests": requests,
+        "cycle": sum(durations) / len(durations),
+        "cpu": cpu / cycles,
+        "cpu_ratio": cpu / wall,
+        # Linux reports kB
+        "memory": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def bench(socket: str, interval: int, cycles: int) -> dict[str, Any]:
+    return asyncio.run(measure(socket, interval, cycles))
+
+
+def run(containers: int, opts: argparse.Namespace) -> dict[str, Any]:
+    ctx = multiprocessing.get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket = os.path.join(tmp, "docker.sock")
+        daemon = ctx.Process(
+            target=serve,
+            args=(socket, containers, opts.latency, opts.churn),
+            daemon=True,
+        )
+        daemon.start()
+
+        try:
+            while not os.path.exists(socket):
+                time.sleep(0.05)
+
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                return pool.submit(bench, socket, opts.interval, opts.cycles).result()
+        finally:
+            daemon.terminate()
+            daemon.join()
+
+
+def main() -> None:
+    args = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args.add_argument("--containers", type=int, nargs="+", default=[10, 100, 1000])
+    args.add_argument("--interval", type=int, default=INTERVAL, help="seconds")
+    args.add_argument("--cycles", type=int, default=CYCLES)
+    args.add_argument("--latency", type=float, default=0.0, help="seconds")
+    args.add_argument("--churn", type=float, default=0.0, help="events/second")
+    opts = args.parse_args()
+
+    print(
+        f"{'containers':>10} {'startup':>9} {'req/cycle':>10} {'cycle':>9}"
+        f" {'cpu/cycle':>11} {'cpu':>6} {'memory':>9}"
+    )
+
+    for containers in opts.containers:
+        result = run(containers, opts)
+        requests = sum(result["requests"].values()) / opts.cycles
+        print(
+            f"{containers:>10} {result['startup']:>8.2f}s {requests:>10.1f}"
+            f" {result['cycle']:>8.3f}s {result['cpu'] * 1000:>9.1f}ms"
+            f" {result['cpu_ratio']:>6.1%} {result['memory']:>7.1f}MB"
+        )
+        for endpoint, count in sorted(result["requests"].items()):
+            print(f"{'':>10}   {endpoint}: {count / opts.cycles:.1f}/cycle")
+
+
+if __name__ == "__main__":
+    main()
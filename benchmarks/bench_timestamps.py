@@ -0,0 +1,50 @@
+"""Microbenchmark of the Docker timestamp parsing in the poll loop.
+
+Run from the repository root (requires the Home Assistant requirements):
+
+    python -m benchmarks.bench_timestamps
+"""
+
+import timeit
+from datetime import timedelta
+
+from dateutil import parser
+
+from custom_components.monitor_docker.helpers import parse_docker_time
+
+NUMBER = 100000
+
+TIMESTAMPS = [
+    "2024-05-01T12:34:56.123456789Z",
+    "2024-05-01T12:34:56.123456789+02:00",
+    "0001-01-01T00:00:00Z",
+]
+
+
+def main() -> None:
+    for value in TIMESTAMPS:
+        # Both parsers must agree, dateutil may round the nanoseconds
+        diff = parse_docker_time(value) - parser.parse(value)
+        assert abs(diff) <= timedelta(microseconds=1)
+
+        dateutil_time = timeit.timeit(lambda: parser.parse(value), number=NUMBER)
+        fast_time = timeit.timeit(lambda: parse_docker_time(value), number=NUMBER)
+
+        # The memo of DockerContainerAPI only does a dict lookup for unchanged values
+        memo = {value: parse_docker_time(value)}
+        memo_time = timeit.timeit(lambda: memo.get(value), number=NUMBER)
+
+        print(f"{value}")
+        print(f"  dateutil.parser.parse: {dateutil_time / NUMBER * 1e6:8.3f} us")
+        print(
+            f"  parse_docker_time:     {fast_time / NUMBER * 1e6:8.3f} us"
+            f" ({dateutil_time / fast_time:.0f}x)"
+        )
+        print(
+            f"  memo hit:              {memo_time / NUMBER * 1e6:8.3f} us"
+            f" ({dateutil_time / memo_time:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""Fake Docker Engine API, simulating N containers for the benchmarks.
+
+Serves the endpoints used by Monitor Docker over a unix socket, with a
+configurable latency per request and churn (start/stop events per second).
+It only needs aiohttp, run it standalone from the repository root:
+
+    python -m benchmarks.fake_docker --containers 100 --socket /tmp/docker.sock
+
+The request counters are available at GET /_bench/requests.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+from aiohttp import web
+
+API_VERSION = "1.43"
+NCPU = 4
+MEM_TOTAL = 16 * 1024**3
+
+
+def _iso(timestamp: float) -> str:
+    """Docker formatted timestamp, with nanoseconds."""
+    value = datetime.fromtimestamp(timestamp, timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f") + "000Z"
+
+
+class FakeContainer:
+    """State of a single simulated container."""
+
+    def __init__(self, idx: int):
+        now = time.time()
+        self.id = f"{idx:08x}" + "0" * 56
+        self.name = f"container-{idx}"
+        self.image = f"image-{idx % 10}:latest"
+        self.image_id = "sha256:" + f"{idx % 10:064x}"
+        self.created = now - 86400
+        self.started = now - 3600
+        self.finished = 0.0
+        self.running = True
+        self.pid = 1000 + idx
+        self.cpu = random.randint(10**9, 10**10)
+        self.rx = random.randint(10**6, 10**8)
+        self.tx = random.randint(10**6, 10**8)
+
+    def list_entry(self) -> dict:
+        return {
+            "Id": self.id,
+            "Names": [f"/{self.name}"],
+            "Image": self.image,
+            "ImageID": self.image_id,
+            "Created": int(self.created),
+            "State": "running" if self.running else "exited",
+            "Status": "Up 1 hour" if self.running else "Exited (0) 1 minute ago",
+            "HostConfig": {"NetworkMode": "bridge"},
+        }
+
+    def inspect(self) -> dict:
+        return {
+            "Id": self.id,
+            "Name": f"/{self.name}",
+            "Created": _iso(self.created),
+            "Image": self.image_id,
+            "Config": {"Image": self.image},
+            "HostConfig": {"NetworkMode": "bridge"},
+            "State": {
+                "Status": "running" if self.running else "exited",
+                "Running": self.running,
+                "Pid": self.pid if self.running else 0,
+                "ExitCode": 0,
+                "StartedAt": _iso(self.started),
+                "FinishedAt": (
+                    _iso(self.finished) if self.finished else "0001-01-01T00:00:00Z"
+                ),
+            },
+        }
+
+    def stats(self) -> dict:
+        now = time.time()
+        precpu = {
+            "cpu_usage": {"total_usage": self.cpu, "percpu_usage": [0] * NCPU},
+            "system_cpu_usage": int(now * 1e9) * NCPU,
+            "online_cpus": NCPU,
+        }
+
+        # Some activity since the previous frame
+        self.cpu += random.randint(10**6, 10**8)
+        self.rx += random.randint(0, 10**5)
+        self.tx += random.randint(0, 10**5)
+
+        return {
+            "read": _iso(now),
+            "preread": _iso(now - 1),
+            "cpu_stats": {
+                "cpu_usage": {"total_usage": self.cpu, "percpu_usage": [0] * NCPU},
+                "system_cpu_usage": int((now + 1) * 1e9) * NCPU,
+                "online_cpus": NCPU,
+            },
+            "precpu_stats": precpu,
+            "memory_stats": {
+                "usage": 200 * 1024**2,
+                "limit": MEM_TOTAL,
+                "stats": {"inactive_file": 20 * 1024**2},
+            },
+            "networks": {"eth0": {"rx_bytes": self.rx, "tx_bytes": self.tx}},
+            "blkio_stats": {
+                "io_service_bytes_recursive": [
+                    {"major": 8, "minor": 0, "op": "Read", "value": 10**6},
+                    {"major": 8, "minor": 0, "op": "Write", "value": 10**6},
+                ]
+            },
+        }
+
+
+class FakeDocker:
+    """Fake Docker daemon with N containers."""
+
+    def __init__(self, containers: int = 10, latency: float = 0.0, churn: float = 0.0):
+        self.latency = latency
+        self.churn = churn
+        self.requests: Counter[str] = Counter()
+        self._containers = [FakeContainer(idx) for idx in range(containers)]
+        self._lookup = {c.id: c for c in self._containers}
+        self._lookup.update({c.name: c for c in self._containers})
+        self._subscribers: list[asyncio.Queue] = []
+        self._churn_task: asyncio.Task | None = None
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+
+        routes = [
+            ("/version", self._version),
+            ("/info", self._info),
+            ("/events", self._events),
+            ("/containers/json", self._list),
+            ("/containers/{id}/json", self._inspect),
+            ("/containers/{id}/stats", self._stats),
+        ]
+
+        # aiodocker prefixes the API version, e.g. /v1.43/info
+        for path, handler in routes:
+            app.router.add_get(path, handler)
+            app.router.add_get("/{api:v[0-9.]+}" + path, handler)
+
+        app.router.add_get("/_bench/requests", self._bench_requests)
+
+        app.on_startup.append(self._start_churn)
+        app.on_cleanup.append(self._stop_churn)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        resource = request.match_info.route.resource
+        path = resource.canonical if resource is not None else request.path
+
+        # The requests of the benchmark itself are not counted, nor delayed
+        if not path.startswith("/_bench"):
+            self.requests[path.replace("/{api}", "")] += 1
+
+            if self.latency:
+                await asyncio.sleep(self.latency)
+
+        return await handler(request)
+
+    async def _version(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"Version": "24.0.7", "ApiVersion": API_VERSION, "Os": "linux"}
+        )
+
+    async def _info(self, request: web.Request) -> web.Response:
+        running = sum(1 for c in self._containers if c.running)
+        return web.json_response(
+            {
+                "ServerVersion": "24.0.7",
+                "Containers": len(self._containers),
+                "ContainersRunning": running,
+                "ContainersPaused": 0,
+                "ContainersStopped": len(self._containers) - running,
+                "Images": 10,
+                "MemTotal": MEM_TOTAL,
+                "NCPU": NCPU,
+                "OperatingSystem": "Fake Linux",
+                "OSType": "linux",
+                "Architecture": "x86_64",
+                "KernelVersion": "6.1.0",
+            }
+        )
+
+    async def _list(self, request: web.Request) -> web.Response:
+        return web.json_response([c.list_entry() for c in self._containers])
+
+    def _container(self, request: web.Request) -> FakeContainer:
+        container = self._lookup.get(request.match_info["id"])
+        if container is None:
+            raise web.HTTPNotFound(
+                text=json.dumps({"message": "No such container"}),
+                content_type="application/json",
+            )
+        return container
+
+    async def _inspect(self, request: web.Request) -> web.Response:
+        return web.json_response(self._container(request).inspect())
+
+    async def _stats(self, request: web.Request) -> web.StreamResponse:
+        container = self._container(request)
+
+        if request.query.get("stream", "1") in ("0", "false", "False"):
+            return web.json_response(container.stats())
+
+        response = web.StreamResponse()
+        response.content_type = "application/json"
+        await response.prepare(request)
+        while container.running:
+            await response.write(json.dumps(container.stats()).encode() + b"\n")
+            await asyncio.sleep(1)
+        return response
+
+    async def _events(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        response.content_type = "application/json"
+        await response.prepare(request)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.append(queue)
+        try:
+            while True:
+                event = await queue.get()
+                await response.write(json.dumps(event).encode() + b"\n")
+        finally:
+            self._subscribers.remove(queue)
+
+    async def _bench_requests(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.requests))
+
+    def _emit(self, container: FakeContainer, action: str) -> None:
+        now = time.time()
+        event = {
+            "Type": "container",
+            "Action": action,
+            "Actor": {
+                "ID": container.id,
+                "Attributes": {"name": container.name, "exitCode": "0"},
+            },
+            "time": int(now),
+            "timeNano": int(now * 1e9),
+        }
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    async def _start_churn(self, _app: web.Application) -> None:
+        if self.churn > 0:
+            self._churn_task = asyncio.create_task(self._run_churn())
+
+    async def _stop_churn(self, _app: web.Application) -> None:
+        if self._churn_task is not None:
+            self._churn_task.cancel()
+
+    async def _run_churn(self) -> None:
+        """Stop or start a random container, churn times per second."""
+
+        while True:
+            await asyncio.sleep(1 / self.churn)
+
+            container = random.choice(self._containers)
+            if container.running:
+                container.running = False
+                container.finished = time.time()
+                self._emit(container, "die")
+                self._emit(container, "stop")
+            else:
+                container.running = True
+                container.started = time.time()
+                self._emit(container, "start")
+
+
+def serve(socket: str, containers: int, latency: float, churn: float) -> None:
+    """Run the fake daemon until interrupted."""
+    fake = FakeDocker(containers, latency, churn)
+    web.run_app(fake.app(), path=socket, print=None)
+
+
+def main() -> None:
+    args = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args.add_argument("--socket", default="/tmp/fake-docker.sock")
+    args.add_argument("--containers", type=int, default=10)
+    args.add_argument("--latency", type=float, default=0.0, help="seconds")
+    args.add_argument("--churn", type=float, default=0.0, help="events/second")
+    opts = args.parse_args()
+
+    serve(opts.socket, opts.containers, opts.latency, opts.churn)
+
+
+if __name__ == "__main__":
+    main()
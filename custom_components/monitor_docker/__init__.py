@@ -18,33 +18,60 @@ from homeassistant.helpers.reload import async_setup_reload_service
 
 from .const import (
     API,
+    CONF_BULK_REFRESH,
     CONF_CERTPATH,
+    CONF_CGROUP_PATH,
+    CONF_CONCURRENCY,
     CONF_CONTAINERS,
     CONF_CONTAINERS_EXCLUDE,
+    CONF_DEADBAND,
+    CONF_DIAGNOSTICS,
+    CONF_DNS_CACHE_TTL,
+    CONF_IDLE_INTERVAL,
+    CONF_IDLE_THRESHOLD,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_MAX_INTERVAL,
     CONF_MEMORYCHANGE,
+    CONF_MIN_INTERVAL,
     CONF_PRECISION_CPU,
     CONF_PRECISION_DISK_MB,
     CONF_PRECISION_MEMORY_MB,
     CONF_PRECISION_MEMORY_PERCENTAGE,
     CONF_PRECISION_NETWORK_KB,
     CONF_PRECISION_NETWORK_MB,
+    CONF_POOL_LIMIT,
+    CONF_POOL_LIMIT_PER_HOST,
     CONF_PREFIX,
+    CONF_PROCFS_PATH,
+    CONF_RECONCILE_INTERVAL,
     CONF_RENAME,
     CONF_RENAME_ENITITY,
     CONF_RETRY,
     CONF_SENSORNAME,
+    CONF_SENSOR_FILTERS,
+    CONF_STATS_STREAM,
+    CONF_STOPPED_INTERVAL,
     CONF_SWITCHENABLED,
     CONF_SWITCHNAME,
+    CONF_TIMEOUTS,
     CONF_BUTTONENABLED,
     CONF_BUTTONNAME,
     CONF_VERSION,
     CONFIG,
     CONTAINER_INFO_ALLINONE,
+    CONTAINER_MONITOR_LIST,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_IDLE_THRESHOLD,
+    DEFAULT_KEEPALIVE_TIMEOUT,
     DEFAULT_NAME,
+    DEFAULT_POOL_LIMIT,
+    DEFAULT_RECONCILE_INTERVAL,
     DEFAULT_RETRY,
     DEFAULT_SENSORNAME,
     DEFAULT_SWITCHNAME,
     DEFAULT_BUTTONNAME,
+    DEFAULT_TIMEOUTS,
     DOMAIN,
     MONITORED_CONDITIONS_LIST,
     PRECISION,
@@ -55,6 +82,25 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=10)
 
+SENSOR_FILTER_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_DEADBAND, default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_MIN_INTERVAL, default=timedelta(0)): cv.time_period,
+        vol.Optional(CONF_MAX_INTERVAL, default=None): vol.Any(cv.time_period, None),
+    }
+)
+
+TIMEOUTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(endpoint, default=timeout): vol.All(
+            vol.Coerce(float), vol.Range(min=1)
+        )
+        for endpoint, timeout in DEFAULT_TIMEOUTS.items()
+    }
+)
+
 DOCKER_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
@@ -80,8 +126,33 @@ DOCKER_SCHEMA = vol.Schema(
         vol.Optional(CONF_SWITCHNAME, default=DEFAULT_SWITCHNAME): cv.string,
         vol.Optional(CONF_BUTTONNAME, default=DEFAULT_BUTTONNAME): cv.string,
         vol.Optional(CONF_CERTPATH, default=""): cv.string,
+        vol.Optional(CONF_CGROUP_PATH, default=""): cv.string,
+        vol.Optional(CONF_PROCFS_PATH, default=""): cv.string,
         vol.Optional(CONF_RETRY, default=DEFAULT_RETRY): cv.positive_int,
         vol.Optional(CONF_MEMORYCHANGE, default=100): cv.positive_int,
+        vol.Optional(CONF_STATS_STREAM, default=False): cv.boolean,
+        vol.Optional(CONF_BULK_REFRESH, default=False): cv.boolean,
+        vol.Optional(
+            CONF_RECONCILE_INTERVAL, default=DEFAULT_RECONCILE_INTERVAL
+        ): cv.positive_int,
+        vol.Optional(CONF_CONCURRENCY, default=DEFAULT_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_POOL_LIMIT, default=DEFAULT_POOL_LIMIT): cv.positive_int,
+        vol.Optional(CONF_POOL_LIMIT_PER_HOST, default=0): cv.positive_int,
+        vol.Optional(
+            CONF_KEEPALIVE_TIMEOUT, default=DEFAULT_KEEPALIVE_TIMEOUT
+        ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(
+            CONF_DNS_CACHE_TTL, default=DEFAULT_DNS_CACHE_TTL
+        ): cv.positive_int,
+        vol.Optional(CONF_TIMEOUTS, default={}): TIMEOUTS_SCHEMA,
+        vol.Optional(CONF_DIAGNOSTICS, default=False): cv.boolean,
+        vol.Optional(CONF_STOPPED_INTERVAL, default=0): cv.positive_int,
+        vol.Optional(CONF_IDLE_INTERVAL, default=0): cv.positive_int,
+        vol.Optional(CONF_IDLE_THRESHOLD, default=DEFAULT_IDLE_THRESHOLD): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
         vol.Optional(CONF_PRECISION_CPU, default=PRECISION): cv.positive_int,
         vol.Optional(CONF_PRECISION_DISK_MB, default=PRECISION): cv.positive_int,
         vol.Optional(CONF_PRECISION_MEMORY_MB, default=PRECISION): cv.positive_int,
@@ -90,6 +161,9 @@ DOCKER_SCHEMA = vol.Schema(
         ): cv.positive_int,
         vol.Optional(CONF_PRECISION_NETWORK_KB, default=PRECISION): cv.positive_int,
         vol.Optional(CONF_PRECISION_NETWORK_MB, default=PRECISION): cv.positive_int,
+        vol.Optional(CONF_SENSOR_FILTERS, default={}): {
+            vol.In(list(CONTAINER_MONITOR_LIST.keys())): SENSOR_FILTER_SCHEMA
+        },
     }
 )
 
@@ -131,13 +205,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             startCount += 1
 
             if doLoop:
-                # Now run forever in this separated thread
-                # loop.run_forever()
-
-                # We only get here if a docker instance disconnected or HASS is stopping
-                if not hass.data[DOMAIN][entry[CONF_NAME]][API]._dockerStopped:
-                    # If HASS stopped, do not retry
-                    break
+                # Connected, the DockerAPI reconnects by itself until HASS stops
+                break
 
     # Setup reload service
     # await async_setup_reload_service(hass, DOMAIN, [DOMAIN])
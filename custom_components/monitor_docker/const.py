@@ -5,42 +5,85 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import PERCENTAGE, UnitOfDataRate, UnitOfInformation
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfDataRate,
+    UnitOfInformation,
+    UnitOfTime,
+)
 
 DOMAIN = "monitor_docker"
 API = "api"
 CONFIG = "config"
 CONTAINER = "container"
 
+CONF_BULK_REFRESH = "bulk_refresh"
 CONF_CERTPATH = "certpath"
+CONF_CGROUP_PATH = "cgroup_path"
 CONF_CONTAINERS = "containers"
+CONF_CONCURRENCY = "concurrency"
 CONF_CONTAINERS_EXCLUDE = "containers_exclude"
+CONF_DEADBAND = "deadband"
+CONF_DIAGNOSTICS = "diagnostics"
+CONF_DNS_CACHE_TTL = "dns_cache_ttl"
+CONF_IDLE_INTERVAL = "idle_interval"
+CONF_IDLE_THRESHOLD = "idle_threshold"
+CONF_KEEPALIVE_TIMEOUT = "keepalive_timeout"
+CONF_MAX_INTERVAL = "max_interval"
 CONF_MEMORYCHANGE = "memorychange"
+CONF_MIN_INTERVAL = "min_interval"
 CONF_PRECISION_CPU = "precision_cpu"
 CONF_PRECISION_DISK_MB = "precision_disk_mb"
 CONF_PRECISION_MEMORY_MB = "precision_memory_mb"
 CONF_PRECISION_MEMORY_PERCENTAGE = "precision_memory_percentage"
 CONF_PRECISION_NETWORK_KB = "precision_network_kb"
 CONF_PRECISION_NETWORK_MB = "precision_network_mb"
+CONF_POOL_LIMIT = "pool_limit"
+CONF_POOL_LIMIT_PER_HOST = "pool_limit_per_host"
 CONF_PREFIX = "prefix"
+CONF_PROCFS_PATH = "procfs_path"
+CONF_RECONCILE_INTERVAL = "reconcile_interval"
 CONF_RENAME = "rename"
 CONF_RENAME_ENITITY = "rename_entity"
 CONF_RETRY = "retry"
 CONF_SENSORNAME = "sensorname"
+CONF_SENSOR_FILTERS = "sensor_filters"
+CONF_STATS_STREAM = "stats_stream"
+CONF_STOPPED_INTERVAL = "stopped_interval"
 CONF_SWITCHENABLED = "switchenabled"
 CONF_SWITCHNAME = "switchname"
+CONF_TIMEOUTS = "timeouts"
 CONF_BUTTONENABLED = "buttonenabled"
 CONF_BUTTONNAME = "buttonname"
 CONF_VERSION = "version"
 
+DEFAULT_CONCURRENCY = 10
+DEFAULT_DNS_CACHE_TTL = 10
+DEFAULT_IDLE_THRESHOLD = 1.0
+DEFAULT_KEEPALIVE_TIMEOUT = 15
 DEFAULT_NAME = "Docker"
+DEFAULT_POOL_LIMIT = 100
+DEFAULT_RECONCILE_INTERVAL = 300
 DEFAULT_RETRY = 60
 DEFAULT_SENSORNAME = "{name} {sensor}"
 DEFAULT_SWITCHNAME = "{name}"
 DEFAULT_BUTTONNAME = "{name} Restart"
 
+# Timeout in seconds per Docker API endpoint, streams have no timeout
+DEFAULT_TIMEOUTS = {
+    "version": 10,
+    "info": 10,
+    "list": 10,
+    "inspect": 10,
+    "stats": 30,
+}
+
 COMPONENTS = ["sensor", "switch", "button"]
 
+# Signal with a batch of added containers, per instance
+SIGNAL_CONTAINERS_ADDED = "monitor_docker_containers_added_{}"
+
 SERVICE_RESTART = "restart"
 
 PRECISION = 2
@@ -56,6 +99,22 @@ DOCKER_STATS_1CPU_PERCENTAGE = "containers_1cpu_percentage"
 DOCKER_STATS_MEMORY = "containers_memory"
 DOCKER_STATS_MEMORY_PERCENTAGE = "containers_memory_percentage"
 
+DOCKER_DIAG_API_LATENCY = "api_latency_{}_p95"
+DOCKER_DIAG_INFO_CYCLE = "info_cycle_duration"
+DOCKER_DIAG_LOOP_LAG = "event_loop_lag"
+DOCKER_DIAG_OVERRUNS = "poll_overruns"
+DOCKER_DIAG_EVENTS_SKIPPED = "events_skipped"
+DOCKER_DIAG_POLL_CYCLE = "poll_cycle_duration"
+
+# Docker API endpoints with a latency sensor
+LATENCY_ENDPOINTS = ["info", "list", "inspect", "stats"]
+
+# Number of samples for the rolling latency statistics
+LATENCY_SAMPLES = 100
+
+# Event loop lag (seconds) of a wakeup which is logged
+LOOP_LAG_LOG = 0.1
+
 CONTAINER_INFO_ALLINONE = "allinone"
 CONTAINER_INFO_STATE = "state"
 CONTAINER_INFO_HEALTH = "health"
@@ -135,6 +194,58 @@ DOCKER_MONITOR_LIST = {
     ),
 }
 
+DIAGNOSTIC_MONITOR_LIST = {
+    **{
+        DOCKER_DIAG_API_LATENCY.format(endpoint): SensorEntityDescription(
+            key=DOCKER_DIAG_API_LATENCY.format(endpoint),
+            name=f"API latency {endpoint} p95",
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            icon="mdi:timer-outline",
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        )
+        for endpoint in LATENCY_ENDPOINTS
+    },
+    DOCKER_DIAG_INFO_CYCLE: SensorEntityDescription(
+        key=DOCKER_DIAG_INFO_CYCLE,
+        name="Info cycle duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:timer-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    DOCKER_DIAG_POLL_CYCLE: SensorEntityDescription(
+        key=DOCKER_DIAG_POLL_CYCLE,
+        name="Poll cycle duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:timer-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    DOCKER_DIAG_LOOP_LAG: SensorEntityDescription(
+        key=DOCKER_DIAG_LOOP_LAG,
+        name="Event loop lag",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        icon="mdi:timer-alert-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    DOCKER_DIAG_OVERRUNS: SensorEntityDescription(
+        key=DOCKER_DIAG_OVERRUNS,
+        name="Poll overruns",
+        icon="mdi:timer-alert-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    DOCKER_DIAG_EVENTS_SKIPPED: SensorEntityDescription(
+        key=DOCKER_DIAG_EVENTS_SKIPPED,
+        name="Events skipped",
+        icon="mdi:filter-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+}
+
 CONTAINER_MONITOR_LIST = {
     CONTAINER_INFO_STATE: SensorEntityDescription(
         key=CONTAINER_INFO_STATE,
@@ -244,6 +355,13 @@ MONITORED_CONDITIONS_LIST = list(DOCKER_MONITOR_LIST.keys()) + list(
 ATTR_NAME = "name"
 ATTR_MEMORY_LIMIT = "Memory_limit"
 ATTR_ONLINE_CPUS = "Online_CPUs"
+ATTR_BACKOFF = "Backoff"
+ATTR_CONNECTION_POOL = "Connection_pool"
+ATTR_LATENCY = "Latency"
+ATTR_POLL_CYCLE_DURATION = "Poll_cycle_duration"
+ATTR_POLL_FAILURES = "Poll_failures"
+ATTR_POLL_INTERVAL = "Poll_interval"
+ATTR_POLL_QUEUE_DEPTH = "Poll_queue_depth"
 ATTR_SERVER = "server"
 ATTR_VERSION_ARCH = "Architecture"
 ATTR_VERSION_KERNEL = "Kernel"
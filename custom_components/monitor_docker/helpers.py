@@ -1,19 +1,32 @@
 """Monitor Docker API helper."""
 
 import asyncio
-import concurrent
+import contextlib
+import json
 import logging
 import os
+import random
+import re
 import ssl
+import time
+from collections import Counter, deque
+from operator import attrgetter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable
 
 import aiodocker
-from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+    UnixConnector,
+)
 import homeassistant.util.dt as dt_util
 from dateutil import parser, relativedelta
 from homeassistant.const import (
+    CONF_MONITORED_CONDITIONS,
     CONF_NAME,
     CONF_SCAN_INTERVAL,
     CONF_URL,
@@ -21,26 +34,50 @@ from homeassistant.const import (
 )
 from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers.discovery import load_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
+    API,
     ATTR_MEMORY_LIMIT,
     ATTR_ONLINE_CPUS,
+    ATTR_BACKOFF,
+    ATTR_CONNECTION_POOL,
+    ATTR_LATENCY,
+    ATTR_POLL_CYCLE_DURATION,
+    ATTR_POLL_FAILURES,
+    ATTR_POLL_INTERVAL,
+    ATTR_POLL_QUEUE_DEPTH,
     ATTR_VERSION_ARCH,
     ATTR_VERSION_KERNEL,
     ATTR_VERSION_OS,
     ATTR_VERSION_OS_TYPE,
     COMPONENTS,
+    CONF_BULK_REFRESH,
     CONF_CERTPATH,
+    CONF_CGROUP_PATH,
+    CONF_CONCURRENCY,
+    CONF_CONTAINERS,
+    CONF_DNS_CACHE_TTL,
+    CONF_IDLE_INTERVAL,
+    CONF_IDLE_THRESHOLD,
+    CONF_KEEPALIVE_TIMEOUT,
     CONF_MEMORYCHANGE,
     CONF_PRECISION_CPU,
-    CONF_PRECISION_DISK_MB,
     CONF_PRECISION_MEMORY_MB,
     CONF_PRECISION_MEMORY_PERCENTAGE,
     CONF_PRECISION_NETWORK_KB,
     CONF_PRECISION_NETWORK_MB,
+    CONF_POOL_LIMIT,
+    CONF_POOL_LIMIT_PER_HOST,
+    CONF_PROCFS_PATH,
+    CONF_RECONCILE_INTERVAL,
     CONF_RETRY,
+    CONF_STATS_STREAM,
+    CONF_STOPPED_INTERVAL,
+    CONF_TIMEOUTS,
     CONF_VERSION,
+    CONFIG,
     CONTAINER,
     CONTAINER_INFO_HEALTH,
     CONTAINER_INFO_IMAGE,
@@ -62,19 +99,67 @@ from .const import (
     DOCKER_INFO_CONTAINER_STOPPED,
     DOCKER_INFO_CONTAINER_TOTAL,
     DOCKER_INFO_IMAGES,
+    DOCKER_DIAG_API_LATENCY,
+    DOCKER_DIAG_INFO_CYCLE,
+    DOCKER_DIAG_LOOP_LAG,
+    DOCKER_DIAG_EVENTS_SKIPPED,
+    DOCKER_DIAG_OVERRUNS,
+    DOCKER_DIAG_POLL_CYCLE,
     DOCKER_INFO_VERSION,
     DOCKER_STATS_1CPU_PERCENTAGE,
     DOCKER_STATS_CPU_PERCENTAGE,
     DOCKER_STATS_MEMORY,
     DOCKER_STATS_MEMORY_PERCENTAGE,
+    LATENCY_ENDPOINTS,
+    LATENCY_SAMPLES,
+    LOOP_LAG_LOG,
     DOMAIN,
     PRECISION,
+    SIGNAL_CONTAINERS_ADDED,
 )
 
 VERSION = "1.20"
 
 _LOGGER = logging.getLogger(__name__)
 
+# Container events which change the state of a container
+CONTAINER_STATE_EVENTS = ["start", "stop", "die", "pause", "unpause", "restart"]
+
+# Container state in the host counters, per container state or event.
+# None means the container does not exist (anymore)
+COUNTER_STATES = {"running": "running", "restarting": "running", "paused": "paused"}
+COUNTER_EVENTS = {
+    "create": "stopped",
+    "start": "running",
+    "restart": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "die": "stopped",
+    "stop": "stopped",
+    "destroy": None,
+}
+
+# Image events which can add an image
+IMAGE_ADD_EVENTS = ["pull", "tag", "load", "import"]
+
+# Container events which add, remove or rename a monitored container
+CONTAINER_CHANGE_EVENTS = ["create", "destroy", "rename"]
+
+# Number of events the daemon keeps for a replay with since. If we replay
+# that many, events are probably lost and the containers are resynced
+EVENTS_REPLAY_LIMIT = 256
+
+# Seconds without create/destroy events before a batch is applied, and the
+# maximum delay of a batch during a continuous stream of events
+CHANGES_DEBOUNCE = 1.0
+CHANGES_DEBOUNCE_MAX = 5.0
+
+# Number of flat polls before the interval of an idle container is stretched
+IDLE_POLLS = 3
+
+# Health as reported in the status of the containers list, e.g. "Up 2 hours (healthy)"
+_LIST_HEALTH = re.compile(r"\((healthy|unhealthy|health: starting)\)")
+
 
 def toKB(value: float, precision: int = PRECISION) -> float:
     """Converts bytes to kBytes."""
@@ -88,6 +173,293 @@ def toMB(value: float, precision: int = PRECISION) -> float:
     return round(value / (1024**2), precision)
 
 
+def parse_docker_time(value: str) -> datetime:
+    """Parse a Docker RFC3339 timestamp with nanoseconds, e.g.
+    2024-05-01T12:34:56.123456789Z. This is a lot faster than dateutil,
+    which is only used if the format is unexpected.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parser.parse(value)
+
+
+def resolve_restart_target(
+    hass: HomeAssistant, cname: str, cserver: str | None
+) -> "DockerContainerAPI | None":
+    """Find the container of a restart service call. The service is shared by
+    all instances, without a server it is the instance of the container.
+    Returns None if the container can not be restarted, the reason is logged.
+    """
+
+    if cserver is not None:
+        if cserver not in hass.data[DOMAIN]:
+            _LOGGER.error("Server '%s' is not configured", cserver)
+            return None
+        elif API not in hass.data[DOMAIN][cserver]:
+            _LOGGER.error("Server '%s' is not connected", cserver)
+            return None
+
+        server_name = cserver
+    else:
+        servers = [
+            server
+            for server, data in hass.data[DOMAIN].items()
+            if API in data and cname in data[API].list_containers()
+        ]
+
+        if len(servers) == 0:
+            _LOGGER.error(
+                "Service restart failed, container '%s' does not exist", cname
+            )
+            return None
+        elif len(servers) > 1:
+            _LOGGER.error(
+                "Service restart failed, container '%s' exists on servers %s, "
+                "specify the server",
+                cname,
+                ", ".join(servers),
+            )
+            return None
+
+        server_name = servers[0]
+
+    server_config = hass.data[DOMAIN][server_name][CONFIG]
+    server_api = hass.data[DOMAIN][server_name][API]
+
+    if len(server_config[CONF_CONTAINERS]) > 0:
+        if cname not in server_config[CONF_CONTAINERS]:
+            _LOGGER.error(
+                "Service restart failed, container '%s' is not configured", cname
+            )
+            return None
+
+        _LOGGER.debug("Trying to restart container '%s'", cname)
+
+    container = server_api.get_container(cname)
+    if container is None:
+        _LOGGER.error("Service restart failed, container '%s' does not exist", cname)
+
+    return container
+
+
+#################################################################
+class CgroupStatsReader:
+    """Read the CPU and memory usage of containers directly from the
+    cgroup v2 filesystem. The result has the same layout as the Docker stats API.
+    """
+
+    def __init__(self, root: str, meminfo: str = "/proc/meminfo"):
+        self._root = Path(root)
+        self._meminfo = Path(meminfo)
+        self._paths: dict[str, Path] = {}
+
+    def find_path(self, container_id: str) -> Path | None:
+        """Find the cgroup directory of a container, for systemd and cgroupfs driver."""
+
+        for path in [
+            self._root / "system.slice" / f"docker-{container_id}.scope",
+            self._root / "docker" / container_id,
+        ]:
+            if (path / "cpu.stat").is_file():
+                return path
+
+        return None
+
+    def _read_memtotal(self) -> int | None:
+        """Total memory of the host, Docker reports this as limit if not set."""
+        for line in self._meminfo.read_text().splitlines():
+            if line.startswith("MemTotal:"):
+                return int(line.split()[1]) * 1024
+
+        return None
+
+    @staticmethod
+    def _read_keyvalue(path: Path) -> dict[str, int]:
+        """Read a flat keyed file like cpu.stat or memory.stat."""
+        result: dict[str, int] = {}
+        for line in path.read_text().splitlines():
+            key, _, value = line.partition(" ")
+            if value.isdigit():
+                result[key] = int(value)
+
+        return result
+
+    def read_stats(self, container_id: str) -> dict[str, Any] | None:
+        """Return the stats of a container, or None if the cgroup is not available.
+        This is blocking I/O, it should run in the executor.
+        """
+
+        path = self._paths.get(container_id)
+        if path is None:
+            path = self.find_path(container_id)
+            if path is None:
+                return None
+            self._paths[container_id] = path
+
+        try:
+            cpu = self._read_keyvalue(path / "cpu.stat")
+            memory_usage = int((path / "memory.current").read_text())
+            memory_stat = self._read_keyvalue(path / "memory.stat")
+            memory_max = (path / "memory.max").read_text().strip()
+            memory_limit = (
+                self._read_memtotal() if memory_max == "max" else int(memory_max)
+            )
+        except (OSError, ValueError):
+            # Container stopped or is removed, find the path again next time
+            del self._paths[container_id]
+            return None
+
+        # The system usage is the wall clock of all CPUs, like Docker does
+        online_cpus = os.cpu_count() or 1
+
+        return {
+            "read": datetime.now(timezone.utc).isoformat(),
+            "cpu_stats": {
+                "cpu_usage": {"total_usage": cpu["usage_usec"] * 1000},
+                "system_cpu_usage": time.time_ns() * online_cpus,
+                "online_cpus": online_cpus,
+            },
+            "memory_stats": {
+                "usage": memory_usage,
+                "limit": memory_limit,
+                "stats": {"inactive_file": memory_stat.get("inactive_file", 0)},
+            },
+        }
+
+
+#################################################################
+class ProcNetReader:
+    """Read the network counters of a container from /proc/<pid>/net/dev.
+    The result has the same layout as the 'networks' of the Docker stats API.
+    """
+
+    def __init__(self, root: str):
+        self._root = Path(root)
+
+    def read_networks(self, pid: int) -> dict[str, dict[str, int]] | None:
+        """Return the rx/tx bytes per interface, or None if the process is gone.
+        This is blocking I/O, it should run in the executor.
+        """
+
+        try:
+            lines = (self._root / str(pid) / "net" / "dev").read_text().splitlines()
+        except OSError:
+            return None
+
+        networks: dict[str, dict[str, int]] = {}
+
+        # First 2 lines are the header
+        for line in lines[2:]:
+            if_name, _, data = line.partition(":")
+            if_name = if_name.strip()
+            fields = data.split()
+
+            if if_name == "lo" or len(fields) < 9:
+                continue
+
+            networks[if_name] = {
+                "rx_bytes": int(fields[0]),
+                "tx_bytes": int(fields[8]),
+            }
+
+        return networks
+
+
+#################################################################
+class Backoff:
+    """Capped exponential backoff with full jitter. Many failing tasks will
+    not retry at the same moment, e.g. after a restart of the Docker daemon.
+    """
+
+    def __init__(self, base: float, cap: float):
+        self._base = max(base, 1)
+        self._cap = max(cap, self._base)
+        self.failures = 0
+        self.delay = 0.0
+
+    def failure(self) -> float:
+        """Register a failure and return the delay before the next attempt."""
+        self.failures += 1
+        self.delay = random.uniform(
+            0, min(self._cap, self._base * 2 ** (self.failures - 1))
+        )
+        return self.delay
+
+    def success(self) -> None:
+        """Reset after a success, the next failure starts with a short delay."""
+        self.failures = 0
+        self.delay = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"failures": self.failures, "delay": round(self.delay, 1)}
+
+
+#################################################################
+class PollCycle:
+    """The polls of one scheduler cycle. The polls of a cycle can still run
+    when the next cycle starts, so the queue peak is kept per cycle.
+    """
+
+    def __init__(self, start: float):
+        self.start = start
+        self.tasks: list[asyncio.Task] = []
+        self.queue_depth_max = 0
+
+
+#################################################################
+class ApiLatency:
+    """Rolling latency statistics and error counts per Docker API endpoint
+    or collection cycle, shared by the Docker API and its containers.
+    """
+
+    def __init__(self):
+        self._samples: dict[str, deque[float]] = {}
+        self._errors: Counter[str] = Counter()
+
+    @contextlib.asynccontextmanager
+    async def measure(self, endpoint: str, timeout: float | None = None):
+        """Time a Docker API call, with an optional timeout."""
+
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                yield
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._errors[endpoint] += 1
+            raise
+        else:
+            self.add(endpoint, time.perf_counter() - start)
+
+    def add(self, endpoint: str, seconds: float) -> None:
+        if endpoint not in self._samples:
+            self._samples[endpoint] = deque(maxlen=LATENCY_SAMPLES)
+        self._samples[endpoint].append(seconds)
+
+    def error(self, endpoint: str) -> None:
+        self._errors[endpoint] += 1
+
+    def summary(self, endpoint: str) -> dict[str, Any]:
+        """Return p50/p95/max in milliseconds, the samples and errors."""
+
+        samples = sorted(self._samples.get(endpoint, ()))
+
+        def percentile(pct: float) -> float | None:
+            if not samples:
+                return None
+            return round(samples[round(pct * (len(samples) - 1))] * 1000, 1)
+
+        return {
+            "p50": percentile(0.5),
+            "p95": percentile(0.95),
+            "max": percentile(1.0),
+            "samples": len(samples),
+            "errors": self._errors[endpoint],
+        }
+
+
 #################################################################
 class DockerAPI:
     """Docker API abstraction allowing multiple Docker instances beeing monitored."""
@@ -101,24 +473,69 @@ class DockerAPI:
         self._containers: dict[str, DockerContainerAPI] = {}
         self._tasks: dict[str, asyncio.Task] = {}
         self._info: dict[str, Any] = {}
-        self._event_create: dict[str, int] = {}
-        self._event_destroy: dict[str, int] = {}
+        self._changes: dict[str, str] = {}
+        self._changes_time = 0.0
         self._dockerStopped = False
+        self._events_active = False
         self._subscribers: list[Callable] = []
+        self._dispatchers: list[Callable[[], None]] = []
         self._api: aiodocker.Docker = None
+        self._stream_api: aiodocker.Docker | None = None
 
         _LOGGER.debug("[%s]: Helper version: %s", self._instance, VERSION)
 
         self._interval: int = config[CONF_SCAN_INTERVAL].seconds
         self._retry_interval: int = config[CONF_RETRY]
+        self._bulk_refresh: bool = config[CONF_BULK_REFRESH]
+        self._semaphore = asyncio.Semaphore(config[CONF_CONCURRENCY])
+        self._queue_depth = 0
+        self._cycle_tasks: set[asyncio.Task] = set()
+        self._timeouts: dict[str, float] = config[CONF_TIMEOUTS]
+        self._connector: TCPConnector | UnixConnector | None = None
+        self._pool_created = 0
+        self._pool_reused = 0
+        self._latency = ApiLatency()
+        self._overruns = 0
+        self._totals: dict[str, tuple[float, float]] = {}
+        self._total_cpu = 0.0
+        self._total_memory = 0.0
+        self._host_notify_pending = False
+        self._reconcile_interval: int = config[CONF_RECONCILE_INTERVAL]
+        self._reconcile_time: float | None = None
+        self._counters_valid = False
+        self._container_states: dict[str, str] = {}
+        self._images: set[str] = set()
+        self._image_tasks: set[asyncio.Task] = set()
+        self._track_images = DOCKER_INFO_IMAGES in config[CONF_MONITORED_CONDITIONS]
+        self._event_filters = self._build_event_filters()
+        self._events_received = 0
+        self._events_skipped = 0
+        self._event_last: int | None = None
+        self._event_boundary: set[tuple[int, str, str]] = set()
+        self._event_lost: float | None = None
+        self._event_skew = 0
+        self._daemon_lost = False
+        self._available = True
+        self._backoff_info = Backoff(self._interval, self._retry_interval)
+        self._backoff_reconnect = Backoff(self._interval, self._retry_interval)
         _LOGGER.debug(
             "[%s] CONF_SCAN_INTERVAL=%d, RETRY=%", self._interval, self._retry_interval
         )
 
     async def init(self, startCount=0):
 
+        # Close the previous clients, otherwise their connection pool leaks
+        for api in (self._api, self._stream_api):
+            if api is not None:
+                try:
+                    await api.close()
+                except Exception:
+                    pass
+
         # Set to None when called twice, etc
         self._api = None
+        self._stream_api = None
+        self._connector = None
 
         try:
             # Try to fix unix:// to unix:/// (3 are required by aiodocker)
@@ -209,26 +626,53 @@ class DockerAPI:
                         self._docker_ssl_context
                     )
 
-                # Setup new TCP connection, otherwise timeout takes toooo long
-                connector = TCPConnector(ssl=ssl_context)
+            # Own connector, for the pool settings
+            streamUrl = url
+            if url is not None:
+                connector = self._new_connector(url, ssl_context)
+
+                # aiodocker requires a dummy host if we supply a unix connector
+                if url.find("unix:") == 0:
+                    url = "unix://localhost"
+
+            # Only limit the connect, the endpoints have their own timeout
+            # and streams (events/stats) should never time out
+            timeout = ClientTimeout(connect=5, sock_connect=5, total=None)
+
+            if connector is not None:
                 session = ClientSession(
                     connector=connector,
-                    timeout=ClientTimeout(
-                        connect=5,
-                        sock_connect=5,
-                        total=10,
-                    ),
+                    timeout=timeout,
+                    trace_configs=[self._pool_trace()],
                 )
+                self._connector = connector
 
             # Initiate the aiodocker instance now
             self._api = aiodocker.Docker(
                 url=url,
                 connector=connector,
                 session=session,
+                timeout=timeout,
                 ssl_context=ssl_context,
                 api_version=self._config[CONF_VERSION],
             )
 
+            # Every running container keeps a stats stream open. They get their
+            # own unlimited pool, otherwise they take all connections of the
+            # pool limit and the other requests wait forever
+            if self._config[CONF_STATS_STREAM] and streamUrl is not None:
+                streamConnector = self._new_connector(
+                    streamUrl, ssl_context, limit=0, limit_per_host=0
+                )
+                self._stream_api = aiodocker.Docker(
+                    url=url,
+                    connector=streamConnector,
+                    session=ClientSession(connector=streamConnector, timeout=timeout),
+                    timeout=timeout,
+                    ssl_context=ssl_context,
+                    api_version=self._config[CONF_VERSION],
+                )
+
         except Exception as err:
             exc_info = True if str(err) == "" else False
             _LOGGER.error(
@@ -239,7 +683,8 @@ class DockerAPI:
             )
             return
 
-        versionInfo = await self._api.version()
+        async with self._latency.measure("version", self._timeouts["version"]):
+            versionInfo = await self._api.version()
         version: str | None = versionInfo.get("Version", None)
 
         # Pre 19.03 support memory calculation is dropped
@@ -252,8 +697,12 @@ class DockerAPI:
         self._tasks["info"] = asyncio.create_task(self._run_docker_info())
 
         # Get the list of containers to monitor
-        containers = await self._api.containers.list(all=True)
+        async with self._latency.measure("list", self._timeouts["list"]):
+            containers = await self._api.containers.list(all=True)
 
+        # The handles are build from the list, no inspect per container. The
+        # first poll of the scheduler does the inspects, concurrently but
+        # limited by the concurrency semaphore
         for container in containers or []:
             # Determine name from Docker API, it contains an array with a slash
             cname: str = container._container["Names"][0][1:]
@@ -267,8 +716,17 @@ class DockerAPI:
                 self._config,
                 self._api,
                 cname,
+                latency=self._latency,
+                on_totals=self._container_totals,
+                stream_api=self._stream_api,
             )
-            await self._containers[cname].init()
+            self._containers[cname].set_event_driven(self._events_active)
+            self._containers[cname].attach(container)
+
+        # Start task which polls the info/stats of all containers, never run 2 of them
+        if "scheduler" in self._tasks:
+            self._tasks["scheduler"].cancel()
+        self._tasks["scheduler"] = asyncio.create_task(self._run_scheduler())
 
         self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._monitor_stop)
 
@@ -281,6 +739,329 @@ class DockerAPI:
                 self._config,
             )
 
+    #############################################################
+    def _build_event_filters(self) -> dict[str, list[str]]:
+        """Filters of the event subscription, so the daemon only sends the
+        events we consume with the enabled features. E.g. without them, the
+        exec_* events of every healthcheck are streamed too.
+        """
+
+        types = [CONTAINER]
+        actions = CONTAINER_STATE_EVENTS + CONTAINER_CHANGE_EVENTS
+
+        # Docker matches health_status as a prefix of "health_status: healthy"
+        if CONTAINER_INFO_HEALTH in self._config[CONF_MONITORED_CONDITIONS]:
+            actions = actions + ["health_status"]
+
+        if self._track_images:
+            types.append("image")
+            actions = actions + ["delete"] + IMAGE_ADD_EVENTS
+
+        return {"type": types, "event": actions}
+
+    #############################################################
+    def _event_wanted(self, event: dict[str, Any]) -> bool:
+        """Check if an event passes our filters, the daemon may not filter."""
+
+        action: str = event["Action"]
+
+        if event["Type"] not in self._event_filters["type"]:
+            return False
+
+        return action in self._event_filters["event"] or (
+            action.startswith("health_status")
+            and "health_status" in self._event_filters["event"]
+        )
+
+    #############################################################
+    async def _reconcile_info(self) -> None:
+        """Get /info and (re)initialize the container/image counters.
+
+        The static information only changes with a restart of the daemon. If
+        the events are active, the containers and images are listed, so the
+        events can maintain the counters from here on.
+        """
+
+        async with self._latency.measure("info", self._timeouts["info"]):
+            info = await self._api.system.info()
+
+        self._info[DOCKER_INFO_VERSION] = info.get("ServerVersion")
+        self._info[ATTR_MEMORY_LIMIT] = info.get("MemTotal")
+        self._info[ATTR_ONLINE_CPUS] = info.get("NCPU")
+        self._info[ATTR_VERSION_OS] = info.get("OperatingSystem")
+        self._info[ATTR_VERSION_OS_TYPE] = info.get("OSType")
+        self._info[ATTR_VERSION_ARCH] = info.get("Architecture")
+        self._info[ATTR_VERSION_KERNEL] = info.get("KernelVersion")
+
+        # Derived totals depend on the memory limit and number of CPUs
+        self._update_totals()
+
+        if not self._events_active:
+            self._counters_valid = False
+            self._info[DOCKER_INFO_CONTAINER_RUNNING] = info.get("ContainersRunning")
+            self._info[DOCKER_INFO_CONTAINER_PAUSED] = info.get("ContainersPaused")
+            self._info[DOCKER_INFO_CONTAINER_STOPPED] = info.get("ContainersStopped")
+            self._info[DOCKER_INFO_CONTAINER_TOTAL] = info.get("Containers")
+            self._info[DOCKER_INFO_IMAGES] = info.get("Images")
+            return
+
+        async with self._latency.measure("list", self._timeouts["list"]):
+            containers = await self._api.containers.list(all=True)
+
+        self._container_states = {
+            container._container["Id"]: COUNTER_STATES.get(
+                container._container["State"], "stopped"
+            )
+            for container in containers or []
+        }
+
+        # The image events are only subscribed if the images are monitored
+        if self._track_images:
+            async with self._latency.measure("list", self._timeouts["list"]):
+                images = await self._api.images.list(all=True)
+            self._images = {image["Id"] for image in images or []}
+        else:
+            self._info[DOCKER_INFO_IMAGES] = info.get("Images")
+        self._counters_valid = True
+        self._update_counters()
+
+    #############################################################
+    def _update_counters(self) -> None:
+        """Set the container/image counters from the event maintained state."""
+
+        states = Counter(self._container_states.values())
+        self._info[DOCKER_INFO_CONTAINER_RUNNING] = states["running"]
+        self._info[DOCKER_INFO_CONTAINER_PAUSED] = states["paused"]
+        self._info[DOCKER_INFO_CONTAINER_STOPPED] = states["stopped"]
+        self._info[DOCKER_INFO_CONTAINER_TOTAL] = len(self._container_states)
+        if self._track_images:
+            self._info[DOCKER_INFO_IMAGES] = len(self._images)
+
+    #############################################################
+    def _counter_event(self, event: dict[str, Any]) -> None:
+        """Maintain the container/image counters with a Docker event."""
+
+        if not self._counters_valid:
+            return
+
+        action: str = event["Action"]
+        actor_id: str = event["Actor"]["ID"]
+
+        if event["Type"] == CONTAINER:
+            if action not in COUNTER_EVENTS:
+                return
+
+            state = COUNTER_EVENTS[action]
+            if state is None:
+                self._container_states.pop(actor_id, None)
+            else:
+                self._container_states[actor_id] = state
+        elif action == "delete":
+            self._images.discard(actor_id)
+        elif action in IMAGE_ADD_EVENTS:
+            # The event can have the image name, the counter needs the id
+            task = asyncio.create_task(self._image_added(actor_id))
+            self._image_tasks.add(task)
+            task.add_done_callback(self._image_tasks.discard)
+            return
+        else:
+            return
+
+        self._update_counters()
+        self._notify_host()
+
+    #############################################################
+    async def _image_added(self, image: str) -> None:
+        """Add an image (name or id) to the image counter."""
+
+        try:
+            async with self._latency.measure("inspect", self._timeouts["inspect"]):
+                raw = await self._api.images.inspect(image)
+        except Exception as err:
+            _LOGGER.debug(
+                "[%s]: Image %s not available (%s)", self._instance, image, str(err)
+            )
+            return
+
+        if self._counters_valid and raw["Id"] not in self._images:
+            self._images.add(raw["Id"])
+            self._update_counters()
+            self._notify_host()
+
+    #############################################################
+    def _container_totals(
+        self, cname: str, cpu: float | None, memory: float | None
+    ) -> None:
+        """A container reports its CPU/memory usage, None when removed. The
+        host totals are kept as running sums, no need to visit all containers.
+        """
+
+        old_cpu, old_memory = self._totals.pop(cname, (0.0, 0.0))
+        if cpu is not None and memory is not None:
+            self._totals[cname] = (cpu, memory)
+        else:
+            cpu = memory = 0.0
+
+        if self._totals:
+            self._total_cpu += cpu - old_cpu
+            self._total_memory += memory - old_memory
+        else:
+            # Start again from zero, no rounding errors left behind
+            self._total_cpu = 0.0
+            self._total_memory = 0.0
+
+        self._update_totals()
+        self._notify_host()
+
+    #############################################################
+    def _update_totals(self) -> None:
+        """Derive the host CPU/memory values from the running sums."""
+
+        # No container reported yet, prevent 0 values in history at start-up
+        if not self._totals:
+            self._info[DOCKER_STATS_CPU_PERCENTAGE] = None
+            self._info[DOCKER_STATS_1CPU_PERCENTAGE] = None
+            self._info[DOCKER_STATS_MEMORY] = None
+            self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = None
+            return
+
+        self._info[DOCKER_STATS_CPU_PERCENTAGE] = round(
+            self._total_cpu, self._config[CONF_PRECISION_CPU]
+        )
+
+        # Calculate for 0-100%
+        if self._info.get(ATTR_ONLINE_CPUS):
+            self._info[DOCKER_STATS_1CPU_PERCENTAGE] = round(
+                self._total_cpu / self._info[ATTR_ONLINE_CPUS],
+                self._config[CONF_PRECISION_CPU],
+            )
+        else:
+            self._info[DOCKER_STATS_1CPU_PERCENTAGE] = None
+
+        self._info[DOCKER_STATS_MEMORY] = round(
+            self._total_memory, self._config[CONF_PRECISION_MEMORY_MB]
+        )
+
+        # Calculate memory percentage
+        if self._info.get(ATTR_MEMORY_LIMIT):
+            self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = round(
+                self._total_memory / toMB(self._info[ATTR_MEMORY_LIMIT], 4) * 100,
+                self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
+            )
+        else:
+            self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = None
+
+    #############################################################
+    def _notify_host(self) -> None:
+        """Push the host values to the sensors. Many containers can report
+        in the same loop iteration, they result in a single notify.
+        """
+
+        if self._host_notify_pending:
+            return
+
+        self._host_notify_pending = True
+        asyncio.get_running_loop().call_soon(self._flush_host)
+
+    #############################################################
+    def _flush_host(self) -> None:
+        self._host_notify_pending = False
+
+        for callback in self._subscribers:
+            callback()
+
+    #############################################################
+    def _update_latency(self) -> None:
+        """Publish the latency statistics for the diagnostic sensors."""
+
+        latency: dict[str, dict[str, Any]] = {}
+
+        for endpoint in LATENCY_ENDPOINTS:
+            key = DOCKER_DIAG_API_LATENCY.format(endpoint)
+            latency[key] = self._latency.summary(endpoint)
+            self._info[key] = latency[key]["p95"]
+
+        latency[DOCKER_DIAG_INFO_CYCLE] = self._latency.summary("info_cycle")
+        latency[DOCKER_DIAG_POLL_CYCLE] = self._latency.summary("poll_cycle")
+        latency[DOCKER_DIAG_LOOP_LAG] = self._latency.summary("loop_lag")
+        self._info.setdefault(DOCKER_DIAG_OVERRUNS, self._overruns)
+
+        # Events which passed the filters of the daemon, but are not used
+        latency[DOCKER_DIAG_EVENTS_SKIPPED] = {
+            "received": self._events_received,
+            "skipped": self._events_skipped,
+            "filters": self._event_filters,
+        }
+        self._info[DOCKER_DIAG_EVENTS_SKIPPED] = self._events_skipped
+
+        # The cycle sensors show the last duration
+        self._info[DOCKER_DIAG_POLL_CYCLE] = (
+            round(self._info[ATTR_POLL_CYCLE_DURATION] * 1000, 1)
+            if self._info.get(ATTR_POLL_CYCLE_DURATION) is not None
+            else None
+        )
+
+        self._info[ATTR_LATENCY] = latency
+
+    #############################################################
+    def _new_connector(
+        self, url: str, ssl_context: ssl.SSLContext | None, **pool: int
+    ) -> TCPConnector | UnixConnector:
+        """Connector with our pool settings, for a tcp/http(s) or unix URL."""
+
+        settings = {**self._pool_settings(), **pool}
+
+        if url.find("unix:") == 0:
+            return UnixConnector(path=url[len("unix://") :], **settings)
+
+        return TCPConnector(
+            ssl=ssl_context, ttl_dns_cache=self._config[CONF_DNS_CACHE_TTL], **settings
+        )
+
+    #############################################################
+    def _pool_settings(self) -> dict[str, Any]:
+        """Connection pool settings of the aiohttp connector."""
+        return {
+            "limit": self._config[CONF_POOL_LIMIT],
+            "limit_per_host": self._config[CONF_POOL_LIMIT_PER_HOST],
+            "keepalive_timeout": self._config[CONF_KEEPALIVE_TIMEOUT],
+        }
+
+    #############################################################
+    def _pool_trace(self) -> TraceConfig:
+        """Count new and reused connections of the connection pool."""
+
+        async def on_create(_session, _context, _params) -> None:
+            self._pool_created += 1
+
+        async def on_reuse(_session, _context, _params) -> None:
+            self._pool_reused += 1
+
+        trace = TraceConfig()
+        trace.on_connection_create_end.append(on_create)
+        trace.on_connection_reuseconn.append(on_reuse)
+        return trace
+
+    #############################################################
+    def _pool_stats(self) -> dict[str, int] | None:
+        """Return the usage of the connection pool."""
+
+        if self._connector is None:
+            return None
+
+        # aiohttp has no public counters of the open connections
+        in_use = len(getattr(self._connector, "_acquired", ()))
+        idle = sum(
+            len(conns) for conns in getattr(self._connector, "_conns", {}).values()
+        )
+
+        return {
+            "open": in_use + idle,
+            "in_use": in_use,
+            "created": self._pool_created,
+            "reused": self._pool_reused,
+        }
+
     #############################################################
     def _docker_ssl_context(self) -> ssl.SSLContext | None:
         """
@@ -303,321 +1084,571 @@ class DockerAPI:
         return context
 
     #############################################################
-    def _monitor_stop(self, _service_or_event: Event) -> None:
-        """Stop the monitor thread."""
+    async def _monitor_stop(self, _service_or_event: Event) -> None:
+        """Stop the monitor tasks and streams, Home Assistant is stopping."""
 
         _LOGGER.info("[%s]: Stopping Monitor Docker thread", self._instance)
 
+        self._dockerStopped = True
+
+        # Closes the stats streams, a poll which is running stops with its task
+        for container in self._containers.values():
+            container.cancel_task()
+
+        tasks = [*self._tasks.values(), *self._cycle_tasks, *self._image_tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for unsubscribe in self._dispatchers:
+            unsubscribe()
+
+        self._dispatchers = []
+
+        for api in (self._api, self._stream_api):
+            if api is not None:
+                try:
+                    await api.close()
+                except Exception:
+                    pass
+
     #############################################################
-    async def _reconnectx(self):
+    def _update_backoff(self) -> None:
+        """Show the backoff state of the host and containers."""
+        self._info[ATTR_BACKOFF] = {
+            "info": self._backoff_info.as_dict(),
+            "reconnect": self._backoff_reconnect.as_dict(),
+            "containers": sum(
+                1 for container in self._containers.values() if container.failures
+            ),
+        }
 
-        while True:
-            _LOGGER.debug("[%s] Reconnecting", self._instance)
+    #############################################################
+    def register_dispatcher(self, unsubscribe: Callable[[], None]) -> None:
+        """Keep the dispatcher subscription of a platform, until the stop."""
+        self._dispatchers.append(unsubscribe)
+
+    #############################################################
+    def register_callback(self, callback: Callable, variable: str) -> None:
+        """Register callback from sensor."""
+        if callback not in self._subscribers:
+            _LOGGER.debug("[%s]: Added callback entity: %s", self._instance, variable)
+            self._subscribers.append(callback)
+
+    #############################################################
+    async def _run_docker_events(self) -> None:
+        """Function to retrieve docker events. We can add or remove monitored containers.
+        A broken event stream is resumed with the events since the last one, so
+        the missed events are replayed instead of a rediscovery of everything.
+        """
+
+        while not self._dockerStopped:
+            # After a break, the entities are unavailable until the daemon is back
+            if self._event_lost is not None:
+                if not await self._ping():
+                    self._set_available(False)
+                    self._daemon_lost = True
+                    delay = self._backoff_reconnect.failure()
+                    self._update_backoff()
+                    _LOGGER.error(
+                        "[%s]: Docker not available. Retry in %d seconds",
+                        self._instance,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                self._set_available(True)
+
+            streamStart = time.time_ns()
+            params = {"filters": json.dumps(self._event_filters)}
+
+            # Resume after the last event, or full resync if too much is missed
+            resync = False
+            if self._event_lost is None:
+                # First subscription, the containers are just listed
+                pass
+            elif (
+                self._event_last is None
+                or self._daemon_lost
+                or time.monotonic() - self._event_lost > self._reconcile_interval
+            ):
+                # A restarted daemon lost its event buffer, e.g. the die/stop
+                # events of its own restart can not be replayed
+                resync = True
+            else:
+                params["since"] = "{}.{:09d}".format(
+                    *divmod(self._event_last, 1_000_000_000)
+                )
+
+            # A new subscriber per subscription, the end of an old stream
+            # publishes None to the subscribers at that moment
+            subscriber = self._api.events.subscribe(create_task=False)
+            runner = asyncio.create_task(self._api.events.run(**params))
 
             try:
-                await self.init()
-                break
+                # Only an established stream maintains the container state
+                if await self._events_established(runner):
+                    self._set_events_active(True)
+
+                    if resync:
+                        await self._resync_containers()
+                        self._daemon_lost = False
+
+                    await self._consume_events(
+                        subscriber, streamStart, "since" in params
+                    )
+                else:
+                    # Raise the error of the subscription
+                    runner.result()
+            except asyncio.CancelledError:
+                await self._stop_events(runner)
+                raise
             except Exception as err:
+                exc_info = True if str(err) == "" else False
                 _LOGGER.error(
-                    "[%s] Failed Docker connect (%s). Retry in %d seconds",
+                    "[%s]: run_docker_events (%s)",
                     self._instance,
                     str(err),
-                    self._retry_interval,
+                    exc_info=exc_info,
                 )
-                await asyncio.sleep(self._retry_interval)
 
-        _LOGGER.debug("[%s] Reconnect success", self._instance)
+            await self._stop_events(runner)
+            del subscriber
 
-    #############################################################
-    def remove_entities(self) -> None:
-        """Remove docker info entities."""
+            # Container state can not be maintained by events anymore
+            self._set_events_active(False)
+            self._event_lost = time.monotonic()
 
-        if len(self._subscribers) > 0:
-            _LOGGER.debug(
-                "[%s]: Removing entities from Docker info",
+            # A broken stream is probably a stopped daemon
+            if not await self._ping():
+                self._set_available(False)
+                self._daemon_lost = True
+
+            # A stream which was running for a while is a new failure
+            if (time.time_ns() - streamStart) / 1e9 > self._retry_interval:
+                self._backoff_reconnect.success()
+
+            delay = self._backoff_reconnect.failure()
+            self._update_backoff()
+            _LOGGER.error(
+                "[%s]: run_docker_events loop ended. Resume in %d seconds",
                 self._instance,
+                delay,
             )
+            await asyncio.sleep(delay)
 
-        for callback in self._subscribers:
-            callback(remove=True)
+    #############################################################
+    async def _events_established(self, runner: asyncio.Task) -> bool:
+        """Wait until the daemon has answered the event subscription."""
+
+        while not runner.done():
+            # aiodocker sets the stream once the response is received
+            if self._api.events.json_stream is not None:
+                return True
 
-        self._subscriber: list[Callable] = []
+            await asyncio.sleep(0.05)
+
+        return False
 
     #############################################################
-    def register_callback(self, callback: Callable, variable: str) -> None:
-        """Register callback from sensor."""
-        if callback not in self._subscribers:
-            _LOGGER.debug("[%s]: Added callback entity: %s", self._instance, variable)
-            self._subscribers.append(callback)
+    async def _stop_events(self, runner: asyncio.Task) -> None:
+        """Cancel the event stream, and wait until it has really ended."""
+
+        runner.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await runner
 
     #############################################################
-    async def _run_docker_events(self) -> None:
-        """Function to retrieve docker events. We can add or remove monitored containers."""
+    async def _ping(self) -> bool:
+        """Check if the Docker daemon responds."""
 
         try:
-            subscriber = self._api.events.subscribe()
+            async with self._latency.measure("version", self._timeouts["version"]):
+                await self._api.version()
+        except Exception as err:
+            _LOGGER.debug("[%s]: Docker not responding (%s)", self._instance, str(err))
+            return False
 
-            while True:
-                event: dict = await subscriber.get()
+        return True
 
-                # Dump all raw events
-                if event is None:
-                    _LOGGER.debug("[%s] run_docker_events RAW: None", self._instance)
-                else:
-                    # If Type=container, give some additional information
-                    addlog = ""
-                    if event["Type"] == "container":
-                        try:
-                            addlog = f", Name={event['Actor']['Attributes']['name']}"
-                        except:
-                            pass
+    #############################################################
+    @property
+    def available(self) -> bool:
+        """False while the Docker daemon is disconnected."""
+        return self._available
 
-                    _LOGGER.debug(
-                        "[%s] run_docker_events Type=%s%s, Action=%s",
-                        self._instance,
-                        event["Type"],
-                        addlog,
-                        event["Action"],
-                    )
+    #############################################################
+    def _set_available(self, available: bool) -> None:
+        """Mark all entities (un)available. On a disconnect the entities and
+        containers are kept, so the history continues after the reconnect.
+        """
 
-                # When we receive none, the connection normally is broken
-                if event is None:
-                    _LOGGER.error("[%s]: run_docker_events loop ended", self._instance)
-
-                    # Set this to know if we stopped or HASS is stopping
-                    self._dockerStopped = True
-
-                    # Remove the docker info sensors
-                    self.remove_entities()
-
-                    # Remove all the sensors/switches/buttons, they will be auto created if connection is working again
-                    for cname in list(self._containers.keys()):
-                        try:
-                            await self._container_remove(cname)
-                        except Exception as err:
-                            exc_info = True if str(err) == "" else False
-                            _LOGGER.error(
-                                "[%s]: Stopping gave an error %s",
-                                self._instance,
-                                str(err),
-                                exc_info=exc_info,
-                            )
+        if available == self._available:
+            return
 
-                    # Stop everything and return to the main thread
-                    self._monitor_stop(self._config[CONF_NAME])
+        self._available = available
 
-                    # TODO: improve reconnectx
-                    await self._reconnectx()
+        if available:
+            _LOGGER.info("[%s]: Docker connection restored", self._instance)
+        else:
+            _LOGGER.warning(
+                "[%s]: Docker connection lost, entities unavailable", self._instance
+            )
 
-                    break
+        for container in self._containers.values():
+            container.set_available(available)
 
-                # Only monitor container events
-                if event["Type"] == CONTAINER:
-                    if event["Action"] == "create":
-                        # Check if another task is running, ifso, we don't create a new one
-                        taskcreated = (
-                            True if self._event_create or self._event_destroy else False
-                        )
+        self._notify_host()
 
-                        cname = event["Actor"]["Attributes"]["name"]
+    #############################################################
+    async def _consume_events(
+        self, subscriber, streamStart: int, resumed: bool
+    ) -> None:
+        """Handle the events of a subscription, until the stream ends."""
 
-                        # Add container name to containers to be monitored this has to
-                        # be a new task, otherwise it will block our event monitoring
-                        if cname not in self._event_create:
-                            _LOGGER.debug(
-                                "[%s] %s: Event create container", self._instance, cname
-                            )
-                            self._event_create[cname] = 0
-                        else:
-                            _LOGGER.error(
-                                "[%s] %s: Event create container, but already in working table?",
-                                self._instance,
-                                cname,
-                            )
+        replayed = 0
+
+        while True:
+            event: dict = await subscriber.get()
+
+            # When we receive none, the connection normally is broken
+            if event is None:
+                _LOGGER.debug("[%s] run_docker_events RAW: None", self._instance)
+                return
 
-                        if self._event_create and not taskcreated:
-                            await self._container_create_destroy()
+            # Dump all raw events
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                # If Type=container, give some additional information
+                addlog = ""
+                if event["Type"] == "container":
+                    try:
+                        addlog = f", Name={event['Actor']['Attributes']['name']}"
+                    except:
+                        pass
 
-                    elif event["Action"] == "destroy":
-                        # Check if another task is running, ifso, we don't create a new one
-                        taskcreated = (
-                            True if self._event_create or self._event_destroy else False
+                _LOGGER.debug(
+                    "[%s] run_docker_events Type=%s%s, Action=%s",
+                    self._instance,
+                    event["Type"],
+                    addlog,
+                    event["Action"],
+                )
+
+            # The since of a resume gives the events of the last timestamp
+            # again. The timestamps are in the clock of the daemon
+            eventTime: int | None = event.get("timeNano")
+            if eventTime is not None:
+                key = (eventTime, event.get("id", ""), event["Action"])
+
+                if eventTime == self._event_last:
+                    if resumed and key in self._event_boundary:
+                        continue
+                    self._event_boundary.add(key)
+                elif self._event_last is None or eventTime > self._event_last:
+                    self._event_last = eventTime
+                    self._event_boundary = {key}
+
+                # The daemon only keeps a limited number of events for a replay
+                if resumed and eventTime < streamStart - self._event_skew:
+                    replayed += 1
+                    if replayed == EVENTS_REPLAY_LIMIT:
+                        _LOGGER.warning(
+                            "[%s]: Too many missed events, resync all containers",
+                            self._instance,
                         )
+                        await self._resync_containers()
+                else:
+                    self._event_skew = time.time_ns() - eventTime
 
-                        cname = event["Actor"]["Attributes"]["name"]
+            self._events_received += 1
 
-                        # Remove container name to containers to be monitored this has to
-                        # be a new task, otherwise it will block our event monitoring
-                        if cname in self._event_create:
-                            _LOGGER.warning(
-                                "[%s] %s: Event destroy received, but create wasn't executed yet",
-                                self._instance,
-                                cname,
-                            )
-                            del self._event_create[cname]
-                        elif cname not in self._event_destroy:
-                            _LOGGER.debug(
-                                "[%s] %s: Event destroy container",
-                                self._instance,
-                                cname,
-                            )
-                            self._event_destroy[cname] = 0
-                        else:
-                            _LOGGER.error(
-                                "%s: Event destroy container, but already in working table?",
-                                cname,
-                            )
+            # The daemon filters the events, but not all versions do
+            if not self._event_wanted(event):
+                self._events_skipped += 1
+                continue
 
-                        if self._event_destroy and not taskcreated:
-                            await self._container_create_destroy()
-                    elif event["Action"] == "rename":
-                        # during a docker-compose up -d <container> the old container can be renamed
-                        # sensors/switch/button should be removed before the new container is monitored
-
-                        # New name
-                        cname = event["Actor"]["Attributes"]["name"]
-
-                        # Old name, and remove leading slash
-                        oname = event["Actor"]["Attributes"]["oldName"]
-                        oname = oname[1:]
-
-                        if oname in self._containers:
-                            _LOGGER.debug(
-                                "[%s] %s: Event rename container to '%s'",
-                                self._instance,
-                                oname,
-                                cname,
-                            )
+            try:
+                self._handle_event(event)
+            except Exception as err:
+                exc_info = True if str(err) == "" else False
+                _LOGGER.error(
+                    "[%s]: run_docker_events (%s)",
+                    self._instance,
+                    str(err),
+                    exc_info=exc_info,
+                )
 
-                            # First remove the newly create container, has a temporary name
-                            if oname in self._event_create:
-                                _LOGGER.warning(
-                                    "[%s] %s: Event rename received, but create wasn't executed yet",
-                                    self._instance,
-                                    oname,
-                                )
-                                del self._event_create[cname]
-                            elif oname not in self._event_destroy:
-                                _LOGGER.debug(
-                                    "[%s] %s: Event rename (destroy) container",
-                                    self._instance,
-                                    oname,
-                                )
-                                self._event_destroy[oname] = 0
-                            else:
-                                _LOGGER.error(
-                                    "%s: Event rename (destroy) container, but already in working table?",
-                                    oname,
-                                )
-
-                            # taskcreate is not unavailable, so remove for now
-                            if self._event_destroy:
-                                await self._container_create_destroy()
-
-                            # Second re-add the container with the original name
-                            taskcreated = (
-                                True
-                                if self._event_create or self._event_destroy
-                                else False
-                            )
+    #############################################################
+    def _handle_event(self, event: dict[str, Any]) -> None:
+        """Apply a Docker event to the counters and the containers."""
 
-                            if cname not in self._event_create:
-                                _LOGGER.debug(
-                                    "[%s] %s: Event rename (create) container",
-                                    self._instance,
-                                    cname,
-                                )
-                                self._event_create[cname] = 0
-                            else:
-                                _LOGGER.error(
-                                    "[%s] %s: Event rename (create) container, but already in working table?",
-                                    self._instance,
-                                    cname,
-                                )
-
-                            if self._event_create and not taskcreated:
-                                await self._container_create_destroy()
-                        else:
-                            _LOGGER.error(
-                                "[%s] %s: Event rename container doesn't exist in list?",
-                                self._instance,
-                                oname,
-                            )
+        # Keep the host counters up-to-date
+        self._counter_event(event)
 
-        except Exception as err:
-            exc_info = True if str(err) == "" else False
+        # Only monitor container events
+        if event["Type"] == CONTAINER:
+            if event["Action"] in CONTAINER_STATE_EVENTS or event[
+                "Action"
+            ].startswith("health_status"):
+                cname = event["Actor"]["Attributes"]["name"]
+
+                # Update the state directly, no need to wait on the next poll
+                if cname in self._containers:
+                    self._containers[cname].apply_event(event)
+
+            elif event["Action"] == "create":
+                cname = event["Actor"]["Attributes"]["name"]
+                self._queue_change(cname, "create")
+
+            elif event["Action"] == "destroy":
+                cname = event["Actor"]["Attributes"]["name"]
+                self._queue_change(cname, "destroy")
+
+            elif event["Action"] == "rename":
+                # during a docker-compose up -d <container> the old container can be renamed
+                # sensors/switch/button should be removed before the new container is monitored
+
+                # New name
+                cname = event["Actor"]["Attributes"]["name"]
+
+                # Old name, and remove leading slash
+                oname = event["Actor"]["Attributes"]["oldName"]
+                oname = oname[1:]
+
+                if oname in self._containers or oname in self._changes:
+                    _LOGGER.debug(
+                        "[%s] %s: Event rename container to '%s'",
+                        self._instance,
+                        oname,
+                        cname,
+                    )
+
+                    # Cached static attributes are outdated now
+                    if oname in self._containers:
+                        self._containers[oname].invalidate_static()
+
+                    # Remove the old name and monitor the new one
+                    self._queue_change(oname, "destroy")
+                    self._queue_change(cname, "create")
+                else:
+                    _LOGGER.error(
+                        "[%s] %s: Event rename container doesn't exist in list?",
+                        self._instance,
+                        oname,
+                    )
+
+    #############################################################
+    async def _resync_containers(self) -> None:
+        """Compare the monitored containers with the containers list, when
+        the missed events can not be replayed. The differences go through
+        the create/destroy queue, and all containers are inspected again.
+        """
+
+        async with self._latency.measure("list", self._timeouts["list"]):
+            containers = await self._api.containers.list(all=True)
+
+        current: dict[str, str] = {
+            container._container["Names"][0][1:]: container._container["Id"]
+            for container in containers or []
+        }
+
+        for cname in list(self._containers):
+            if cname not in current:
+                if self._changes.get(cname) != "destroy":
+                    self._queue_change(cname, "destroy")
+            elif current[cname] != self._containers[cname].container_id:
+                # Recreated with the same name
+                self._queue_change(cname, "destroy")
+                self._queue_change(cname, "create")
+            else:
+                self._containers[cname].invalidate_static()
+
+        for cname in current:
+            if cname not in self._containers and cname not in self._changes:
+                self._queue_change(cname, "create")
+
+    #############################################################
+    def _set_events_active(self, active: bool) -> None:
+        """Tell all containers if their state is maintained by the events."""
+        self._events_active = active
+
+        # The counters need a reconcile once the events are active (again)
+        self._counters_valid = False
+
+        for container in self._containers.values():
+            container.set_event_driven(active)
+
+    #############################################################
+    def _queue_change(self, cname: str, action: str) -> None:
+        """Queue a create or destroy of a container. Only the net change is
+        kept, e.g. a create followed by a destroy cancels out.
+        """
+
+        pending = self._changes.get(cname)
+
+        if action == "create":
+            if pending is None:
+                _LOGGER.debug("[%s] %s: Event create container", self._instance, cname)
+                self._changes[cname] = "create"
+            elif pending == "destroy":
+                # Same name, but a new container
+                self._changes[cname] = "recreate"
+            else:
+                _LOGGER.error(
+                    "[%s] %s: Event create container, but already in working table?",
+                    self._instance,
+                    cname,
+                )
+        elif pending == "create":
+            _LOGGER.debug(
+                "[%s] %s: Event destroy received, but create wasn't executed yet",
+                self._instance,
+                cname,
+            )
+            del self._changes[cname]
+        elif pending == "destroy":
             _LOGGER.error(
-                "[%s]: run_docker_events (%s)",
+                "[%s] %s: Event destroy container, but already in working table?",
                 self._instance,
-                str(err),
-                exc_info=exc_info,
+                cname,
             )
+        else:
+            _LOGGER.debug("[%s] %s: Event destroy container", self._instance, cname)
+            self._changes[cname] = "destroy"
+
+        self._changes_time = time.monotonic()
+
+        # Apply them in their own task, the events may never be blocked
+        task = self._tasks.get("changes")
+        if self._changes and (task is None or task.done()):
+            self._tasks["changes"] = asyncio.create_task(self._run_container_changes())
 
     #############################################################
-    async def _container_create_destroy(self) -> None:
-        """Handles create or destroy of container events."""
+    async def _run_container_changes(self) -> None:
+        """Apply the queued create/destroy changes. The changes are debounced,
+        a docker compose up gives a burst of events, and all new containers
+        of a batch are attached concurrently.
+        """
 
         try:
-            while self._event_create or self._event_destroy:
-                # Go through create loop first
-                for cname in self._event_create:
-                    if self._event_create[cname] > 2:
-                        del self._event_create[cname]
-                        await self._container_add(cname)
+            while self._changes:
+                # Wait until the events are quiet, but not forever
+                batchStart = time.monotonic()
+                while True:
+                    delay = min(
+                        self._changes_time + CHANGES_DEBOUNCE,
+                        batchStart + CHANGES_DEBOUNCE_MAX,
+                    ) - time.monotonic()
+                    if delay <= 0:
                         break
-                    else:
-                        self._event_create[cname] += 1
-                else:
-                    # If all create, we can handle the destroy loop
-                    for cname in self._event_destroy:
-                        await self._container_remove(cname)
+                    await asyncio.sleep(delay)
 
-                    self._event_destroy = {}
+                changes, self._changes = self._changes, {}
 
-                # Sleep for 1 second, don't try to create it too fast
-                await asyncio.sleep(1)
+                removed = [
+                    cname for cname, action in changes.items() if action == "destroy"
+                ]
+                await asyncio.gather(
+                    *(self._container_remove(cname) for cname in removed)
+                )
+
+                # A recreated container keeps its entities, they are bound
+                # to the new container with the same name
+                rebound = [
+                    cname
+                    for cname, action in changes.items()
+                    if action == "recreate" and cname in self._containers
+                ]
+                await asyncio.gather(
+                    *(self._container_rebind(cname) for cname in rebound)
+                )
+
+                created = [
+                    cname
+                    for cname, action in changes.items()
+                    if action == "create"
+                    or (action == "recreate" and cname not in rebound)
+                ]
+                results = await asyncio.gather(
+                    *(self._container_add(cname) for cname in created)
+                )
 
+                # The platforms add the entities of the batch at once
+                added = [cname for cname, result in zip(created, results) if result]
+                if added:
+                    async_dispatcher_send(
+                        self._hass,
+                        SIGNAL_CONTAINERS_ADDED.format(self._instance),
+                        added,
+                    )
+
+                _LOGGER.debug(
+                    "[%s]: Removed %d, rebound %d and added %d container(s)",
+                    self._instance,
+                    len(removed),
+                    len(rebound),
+                    sum(results),
+                )
+
+        except asyncio.CancelledError:
+            raise
         except Exception as err:
             exc_info = True if str(err) == "" else False
             _LOGGER.error(
-                "[%s]: container_create_destroy (%s)",
+                "[%s]: run_container_changes (%s)",
                 self._instance,
                 str(err),
                 exc_info=exc_info,
             )
 
     #############################################################
-    async def _container_add(self, cname: str) -> None:
+    async def _container_add(self, cname: str) -> bool:
+        """Start monitoring a new container, True if it is attached."""
+
         if cname in self._containers:
             _LOGGER.error("[%s] %s: Container already monitored", self._instance, cname)
-            return
+            return False
 
         _LOGGER.debug("[%s] %s: Starting Container Monitor", self._instance, cname)
 
         # Create our Docker Container API
-        self._containers[cname] = DockerContainerAPI(
-            self._config, self._api, cname, atInit=False
+        container = DockerContainerAPI(
+            self._config,
+            self._api,
+            cname,
+            latency=self._latency,
+            on_totals=self._container_totals,
+            stream_api=self._stream_api,
         )
 
-        # We should wait until container is attached
-        result = await self._containers[cname]._initGetContainer()
-
-        if result:
-            # Lets wait 1 second before we try to create sensors/switches/buttons
-            await asyncio.sleep(1)
+        # We should wait until container is attached. Only then it is listed,
+        # a platform which sets up meanwhile would create incomplete entities
+        async with self._semaphore:
+            result = await container._initGetContainer()
 
-            for component in COMPONENTS:
-                load_platform(
-                    self._hass,
-                    component,
-                    DOMAIN,
-                    {CONF_NAME: self._instance, CONTAINER: cname},
-                    self._config,
-                )
-        else:
+        if not result:
             _LOGGER.error(
                 "[%s] %s: Problem during start of monitoring", self._instance, cname
             )
+            return False
+
+        container.set_event_driven(self._events_active)
+        self._containers[cname] = container
+
+        return True
+
+    #############################################################
+    async def _container_rebind(self, cname: str) -> None:
+        """Bind the monitor and its entities to the recreated container."""
+
+        _LOGGER.debug("[%s] %s: Rebinding Container Monitor", self._instance, cname)
+
+        async with self._semaphore:
+            result = await self._containers[cname].rebind()
+
+        if not result:
+            await self._container_remove(cname)
 
     #############################################################
     async def _container_remove(self, cname: str) -> None:
@@ -625,6 +1656,7 @@ class DockerAPI:
             _LOGGER.debug("[%s] %s: Stopping Container Monitor", self._instance, cname)
             self._containers[cname].cancel_task()
             self._containers[cname].remove_entities()
+            self._container_totals(cname, None, None)
             await asyncio.sleep(0.1)
             del self._containers[cname]
         else:
@@ -634,146 +1666,28 @@ class DockerAPI:
     async def _run_docker_info(self) -> None:
         """Function to retrieve information like docker info."""
 
-        loopInit = False
-        self._dockerStopped = False
-
         while True:
 
             error = True
+            queried = False
+            cycleStart = time.perf_counter()
 
             try:
                 if self._dockerStopped:
                     _LOGGER.debug("[%s]: Stopping docker info thread", self._instance)
                     break
 
-                info = await self._api.system.info()
-                self._info[DOCKER_INFO_VERSION] = info.get("ServerVersion")
-                self._info[DOCKER_INFO_CONTAINER_RUNNING] = info.get(
-                    "ContainersRunning"
-                )
-                self._info[DOCKER_INFO_CONTAINER_PAUSED] = info.get("ContainersPaused")
-                self._info[DOCKER_INFO_CONTAINER_STOPPED] = info.get(
-                    "ContainersStopped"
-                )
-                self._info[DOCKER_INFO_CONTAINER_TOTAL] = info.get("Containers")
-                self._info[DOCKER_INFO_IMAGES] = info.get("Images")
-
-                self._info[ATTR_MEMORY_LIMIT] = info.get("MemTotal")
-                self._info[ATTR_ONLINE_CPUS] = info.get("NCPU")
-                self._info[ATTR_VERSION_OS] = info.get("OperatingSystem")
-                self._info[ATTR_VERSION_OS_TYPE] = info.get("OSType")
-                self._info[ATTR_VERSION_ARCH] = info.get("Architecture")
-                self._info[ATTR_VERSION_KERNEL] = info.get("KernelVersion")
-
-                self._info[DOCKER_STATS_CPU_PERCENTAGE] = 0.0
-                self._info[DOCKER_STATS_1CPU_PERCENTAGE] = 0.0
-                self._info[DOCKER_STATS_MEMORY] = 0
-                self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = 0.0
-
-                # Now go through all containers and get the cpu/memory stats
-                for container in self._containers.values():
-                    try:
-                        info = container.get_info()
-                        if info.get(CONTAINER_INFO_STATE) == "running":
-                            stats = container.get_stats()
-                            if stats.get(CONTAINER_STATS_CPU_PERCENTAGE) is not None:
-                                self._info[DOCKER_STATS_CPU_PERCENTAGE] += stats.get(
-                                    CONTAINER_STATS_CPU_PERCENTAGE
-                                )
-                            if stats.get(CONTAINER_STATS_MEMORY) is not None:
-                                self._info[DOCKER_STATS_MEMORY] += stats.get(
-                                    CONTAINER_STATS_MEMORY
-                                )
-                    except Exception as err:
-                        exc_info = True if str(err) == "" else False
-                        _LOGGER.error(
-                            "[%s]: run_docker_info memory/cpu of X (%s)",
-                            self._instance,
-                            str(err),
-                            exc_info=exc_info,
-                        )
-
-                # Calculate memory percentage
+                # Counters are maintained by the events, /info is only needed
+                # at startup, without events and on reconcile
+                now = time.monotonic()
                 if (
-                    self._info[ATTR_MEMORY_LIMIT] is not None
-                    and self._info[ATTR_MEMORY_LIMIT] != 0
+                    not self._counters_valid
+                    or self._reconcile_time is None
+                    or now - self._reconcile_time >= self._reconcile_interval
                 ):
-                    self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = round(
-                        self._info[DOCKER_STATS_MEMORY]
-                        / toMB(self._info[ATTR_MEMORY_LIMIT], 4)
-                        * 100,
-                        self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
-                    )
-
-                # Try to fix possible 0 values in history at start-up
-                if loopInit:
-                    self._info[DOCKER_STATS_CPU_PERCENTAGE] = round(
-                        self._info[DOCKER_STATS_CPU_PERCENTAGE],
-                        self._config[CONF_PRECISION_CPU],
-                    )
-
-                    # Calculate for 0-100%
-                    if self._info[DOCKER_STATS_CPU_PERCENTAGE] is None:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = None
-                    else:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = round(
-                            (
-                                self._info[DOCKER_STATS_CPU_PERCENTAGE]
-                                / self._info[ATTR_ONLINE_CPUS]
-                            ),
-                            self._config[CONF_PRECISION_CPU],
-                        )
-
-                    self._info[DOCKER_STATS_MEMORY] = round(
-                        self._info[DOCKER_STATS_MEMORY],
-                        self._config[CONF_PRECISION_MEMORY_MB],
-                    )
-
-                    self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = round(
-                        self._info[DOCKER_STATS_MEMORY_PERCENTAGE],
-                        self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
-                    )
-                else:
-                    self._info[DOCKER_STATS_CPU_PERCENTAGE] = (
-                        None
-                        if self._info[DOCKER_STATS_CPU_PERCENTAGE] == 0.0
-                        else round(
-                            self._info[DOCKER_STATS_CPU_PERCENTAGE],
-                            self._config[CONF_PRECISION_CPU],
-                        )
-                    )
-
-                    # Calculate for 0-100%
-                    if self._info[DOCKER_STATS_CPU_PERCENTAGE] == 0.0:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = None
-                    elif self._info[DOCKER_STATS_CPU_PERCENTAGE] is None:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = None
-                    else:
-                        self._info[DOCKER_STATS_1CPU_PERCENTAGE] = round(
-                            (
-                                self._info[DOCKER_STATS_CPU_PERCENTAGE]
-                                / self._info[ATTR_ONLINE_CPUS]
-                            ),
-                            self._config[CONF_PRECISION_CPU],
-                        )
-
-                    self._info[DOCKER_STATS_MEMORY] = (
-                        None
-                        if self._info[DOCKER_STATS_MEMORY] == 0.0
-                        else round(
-                            self._info[DOCKER_STATS_MEMORY],
-                            self._config[CONF_PRECISION_MEMORY_MB],
-                        )
-                    )
-
-                    self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = (
-                        None
-                        if self._info[DOCKER_STATS_MEMORY_PERCENTAGE] == 0.0
-                        else round(
-                            self._info[DOCKER_STATS_MEMORY_PERCENTAGE],
-                            self._config[CONF_PRECISION_MEMORY_PERCENTAGE],
-                        )
-                    )
+                    queried = True
+                    await self._reconcile_info()
+                    self._reconcile_time = now
 
                 _LOGGER.debug(
                     "[%s]: Version: %s, Containers: %s, Running: %s, CPU: %s%%, 1CPU: %s%%, Memory: %sMB, %s%%",
@@ -787,29 +1701,224 @@ class DockerAPI:
                     self._info[DOCKER_STATS_MEMORY_PERCENTAGE],
                 )
 
-                loopInit = True
                 error = False
 
             except asyncio.TimeoutError as err:
+                delay = self._backoff_info.failure()
                 _LOGGER.error(
-                    "[%s]: run_docker_info (%s) TCP Timeout. Retry in %d seconds",
+                    "[%s]: run_docker_info TCP Timeout. Retry in %d seconds",
                     self._instance,
-                    self._retry_interval,
+                    delay,
                 )
             except Exception as err:
+                delay = self._backoff_info.failure()
                 exc_info = True if str(err) == "" else False
                 _LOGGER.error(
                     "[%s]: run_docker_info (%s). Retry in %d seconds",
                     self._instance,
                     str(err),
-                    self._retry_interval,
+                    delay,
                     exc_info=exc_info,
                 )
 
             if error:
-                await asyncio.sleep(self._retry_interval)
+                self._latency.error("info_cycle")
+            elif queried:
+                # Only a cycle with an /info request is a sample of its duration
+                duration = time.perf_counter() - cycleStart
+                self._latency.add("info_cycle", duration)
+                self._info[DOCKER_DIAG_INFO_CYCLE] = round(duration * 1000, 1)
+
+                if duration > self._interval:
+                    self._overrun("Info cycle", duration - self._interval)
+
+            if not error:
+                self._backoff_info.success()
+
+            self._update_backoff()
+            self._update_latency()
+            self._info[ATTR_CONNECTION_POOL] = self._pool_stats()
+            self._notify_host()
+
+            if error:
+                await asyncio.sleep(delay)
             else:
-                await asyncio.sleep(self._interval)
+                await self._watchdog_sleep(self._interval)
+
+    #############################################################
+    async def _watchdog_sleep(self, delay: float) -> None:
+        """Sleep and measure how late the event loop wakes us up. A high lag
+        means the loop is blocked or overloaded.
+        """
+
+        start = time.monotonic()
+        await asyncio.sleep(delay)
+        lag = max(time.monotonic() - start - delay, 0)
+
+        self._latency.add("loop_lag", lag)
+        self._info[DOCKER_DIAG_LOOP_LAG] = round(lag * 1000, 1)
+
+        if lag >= LOOP_LAG_LOG:
+            _LOGGER.debug(
+                "[%s]: Event loop lag of %.3fs after a sleep of %.1fs",
+                self._instance,
+                lag,
+                delay,
+            )
+
+    #############################################################
+    def _overrun(self, what: str, late: float) -> None:
+        """The info cycle or a container poll is late on its schedule."""
+
+        self._overruns += 1
+        self._info[DOCKER_DIAG_OVERRUNS] = self._overruns
+
+        _LOGGER.debug(
+            "[%s]: %s is %.3fs late, interval is %ds (%d overruns)",
+            self._instance,
+            what,
+            late,
+            self._interval,
+            self._overruns,
+        )
+
+    #############################################################
+    async def _run_scheduler(self) -> None:
+        """Single timer loop polling all containers. The containers are spread
+        over the interval and the number of concurrent polls is limited.
+        """
+
+        # At startup nothing is inspected yet, do all of them at once (still
+        # limited by the semaphore) instead of spreading them
+        spread = False
+
+        while True:
+            if self._dockerStopped:
+                _LOGGER.debug("[%s]: Stopping scheduler thread", self._instance)
+                break
+
+            # Nothing to poll while the daemon is disconnected
+            if not self._available:
+                await self._watchdog_sleep(self._interval)
+                continue
+
+            cycleStart = time.monotonic()
+            cycle = PollCycle(cycleStart)
+
+            # Refresh the info of all containers with a single list request,
+            # not needed while the state is maintained by the events
+            if self._bulk_refresh and not self._events_active:
+                await self._refresh_containers_list()
+
+            containers = list(self._containers.values())
+            step = self._interval / max(len(containers), 1) if spread else 0
+            spread = True
+
+            for idx, container in enumerate(containers):
+                delay = cycleStart + idx * step - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                scheduled = cycleStart + idx * step
+
+                # The previous poll is still running, this turn is missed
+                if container.polling:
+                    self._overrun(
+                        f"Poll of {container.name}", time.monotonic() - scheduled
+                    )
+                elif container.poll_due(time.monotonic()):
+                    # The startup burst is not on a schedule
+                    cycle.tasks.append(
+                        asyncio.create_task(
+                            self._poll_container(
+                                container, cycle, scheduled if step else None
+                            )
+                        )
+                    )
+
+            # The next cycle is anchored at the interval, it does not wait on
+            # the last polls. They report the cycle duration when done
+            if cycle.tasks:
+                task = asyncio.create_task(self._poll_cycle_done(cycle))
+                self._cycle_tasks.add(task)
+                task.add_done_callback(self._cycle_tasks.discard)
+
+            delay = cycleStart + self._interval - time.monotonic()
+            await self._watchdog_sleep(max(delay, 0))
+
+    #############################################################
+    async def _poll_cycle_done(self, cycle: PollCycle) -> None:
+        """Report the duration of a poll cycle, once all its polls are done."""
+
+        # A hanging poll should not keep this forever
+        await asyncio.wait(cycle.tasks, timeout=2 * self._interval)
+
+        duration = time.monotonic() - cycle.start
+        self._info[ATTR_POLL_CYCLE_DURATION] = round(duration, 3)
+        self._info[ATTR_POLL_QUEUE_DEPTH] = cycle.queue_depth_max
+        self._latency.add("poll_cycle", duration)
+
+        _LOGGER.debug(
+            "[%s]: Scheduler polled %d container(s) in %ss, queue depth %d",
+            self._instance,
+            len(cycle.tasks),
+            self._info[ATTR_POLL_CYCLE_DURATION],
+            cycle.queue_depth_max,
+        )
+
+    #############################################################
+    async def _poll_container(
+        self,
+        container: "DockerContainerAPI",
+        cycle: PollCycle,
+        scheduled: float | None,
+    ) -> None:
+        """Poll a single container, limited by the concurrency semaphore."""
+
+        self._queue_depth += 1
+        cycle.queue_depth_max = max(cycle.queue_depth_max, self._queue_depth)
+        waiting = True
+
+        try:
+            async with self._semaphore:
+                self._queue_depth -= 1
+                waiting = False
+
+                # Waiting on the semaphore beyond the slack of poll_due
+                if scheduled is not None:
+                    late = time.monotonic() - scheduled
+                    if late > self._interval / 2:
+                        self._overrun(f"Poll of {container.name}", late)
+
+                await container.poll()
+        finally:
+            if waiting:
+                self._queue_depth -= 1
+
+    #############################################################
+    async def _refresh_containers_list(self) -> None:
+        """Refresh the info of all containers with a single list request."""
+
+        try:
+            async with self._latency.measure("list", self._timeouts["list"]):
+                containers = await self._api.containers.list(all=True)
+
+            for container in containers or []:
+                cname: str = container._container["Names"][0][1:]
+
+                if cname in self._containers:
+                    self._containers[cname].set_list_info(container._container)
+
+        except asyncio.TimeoutError:
+            _LOGGER.error("[%s]: refresh_containers_list TCP Timeout", self._instance)
+        except Exception as err:
+            exc_info = True if str(err) == "" else False
+            _LOGGER.error(
+                "[%s]: refresh_containers_list (%s)",
+                self._instance,
+                str(err),
+                exc_info=exc_info,
+            )
 
     #############################################################
     def list_containers(self):
@@ -825,9 +1934,134 @@ class DockerAPI:
             )
             return None
 
-    #############################################################
-    def get_info(self) -> dict[str, Any]:
-        return self._info
+    #############################################################
+    def get_info(self) -> dict[str, Any]:
+        return self._info
+
+
+#################################################################
+class SlotRecord:
+    """Base of the slotted container records. The record is updated in place
+    every poll, get() and the other dict methods give a cheap read-only view
+    on the public keys, like the dictionaries used before.
+    """
+
+    __slots__ = ()
+
+    # Public key and slot name of the fields
+    FIELDS: tuple[tuple[str, str], ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.KEYS = tuple(key for key, _ in cls.FIELDS)
+        cls._slot = dict(cls.FIELDS)
+        cls._values = attrgetter(*(slot for _, slot in cls.FIELDS))
+
+    def __init__(self):
+        for slot in self.__slots__:
+            setattr(self, slot, None)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        slot = self._slot.get(key)
+        if slot is None:
+            return default
+
+        value = getattr(self, slot)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, self._slot[key])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        setattr(self, self._slot[key], value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slot
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def keys(self) -> tuple[str, ...]:
+        return self.KEYS
+
+    def items(self) -> list[tuple[str, Any]]:
+        return list(zip(self.KEYS, self.values()))
+
+    def values(self) -> tuple:
+        """All values in the order of KEYS, also used as snapshot."""
+        return self._values(self)
+
+
+#################################################################
+class ContainerInfo(SlotRecord):
+    """Information of a container, see get_info()."""
+
+    __slots__ = (
+        "state",
+        "health",
+        "status",
+        "network_available",
+        "uptime",
+        "image",
+        "image_hash",
+        "poll_interval",
+        "poll_failures",
+    )
+
+    FIELDS = (
+        (CONTAINER_INFO_STATE, "state"),
+        (CONTAINER_INFO_HEALTH, "health"),
+        (CONTAINER_INFO_STATUS, "status"),
+        (CONTAINER_INFO_NETWORK_AVAILABLE, "network_available"),
+        (CONTAINER_INFO_UPTIME, "uptime"),
+        (CONTAINER_INFO_IMAGE, "image"),
+        (CONTAINER_INFO_IMAGE_HASH, "image_hash"),
+        (ATTR_POLL_INTERVAL, "poll_interval"),
+        (ATTR_POLL_FAILURES, "poll_failures"),
+    )
+
+
+#################################################################
+class ContainerStats(SlotRecord):
+    """Statistics of a running container, see get_stats()."""
+
+    __slots__ = (
+        "read",
+        "cpu_percentage",
+        "cpu1_percentage",
+        "memory",
+        "memory_percentage",
+        "network_speed_up",
+        "network_speed_down",
+        "network_total_up",
+        "network_total_down",
+    )
+
+    FIELDS = (
+        ("read", "read"),
+        (CONTAINER_STATS_CPU_PERCENTAGE, "cpu_percentage"),
+        (CONTAINER_STATS_1CPU_PERCENTAGE, "cpu1_percentage"),
+        (CONTAINER_STATS_MEMORY, "memory"),
+        (CONTAINER_STATS_MEMORY_PERCENTAGE, "memory_percentage"),
+        (CONTAINER_STATS_NETWORK_SPEED_UP, "network_speed_up"),
+        (CONTAINER_STATS_NETWORK_SPEED_DOWN, "network_speed_down"),
+        (CONTAINER_STATS_NETWORK_TOTAL_UP, "network_total_up"),
+        (CONTAINER_STATS_NETWORK_TOTAL_DOWN, "network_total_down"),
+    )
+
+
+# Order of the values in the notify snapshot of a container
+_SNAPSHOT_KEYS = ContainerInfo.KEYS + ContainerStats.KEYS
+
+# Values of a container which are part of the host totals
+_TOTALS_KEYS = {
+    CONTAINER_INFO_STATE,
+    CONTAINER_STATS_CPU_PERCENTAGE,
+    CONTAINER_STATS_MEMORY,
+}
 
 
 #################################################################
@@ -839,19 +2073,61 @@ class DockerContainerAPI:
         config: ConfigType,
         api: aiodocker.Docker,
         cname: str,
-        atInit=True,
+        latency: ApiLatency | None = None,
+        on_totals: Callable[[str, float | None, float | None], None] | None = None,
+        stream_api: aiodocker.Docker | None = None,
     ):
         self._config = config
         self._api = api
+        self._stream_api = stream_api
         self._instance: str = config[CONF_NAME]
         self._memChange: int = config[CONF_MEMORYCHANGE]
         self._name = cname
         self._interval: int = config[CONF_SCAN_INTERVAL].seconds
         self._retry_interval: int = config[CONF_RETRY]
+        self._stats_stream: bool = config[CONF_STATS_STREAM]
+        self._bulk_refresh: bool = config[CONF_BULK_REFRESH]
+        self._reconcile_interval: int = config[CONF_RECONCILE_INTERVAL]
+        self._stopped_interval: int = config[CONF_STOPPED_INTERVAL]
+        self._idle_interval: int = config[CONF_IDLE_INTERVAL]
+        self._idle_threshold: float = config[CONF_IDLE_THRESHOLD]
+        self._timeouts: dict[str, float] = config[CONF_TIMEOUTS]
+        self._latency = latency if latency is not None else ApiLatency()
+        self._on_totals = on_totals
+        self._cgroup: CgroupStatsReader | None = None
+        self._procfs: ProcNetReader | None = None
+        if config[CONF_CGROUP_PATH]:
+            if config[CONF_PROCFS_PATH]:
+                self._cgroup = CgroupStatsReader(
+                    config[CONF_CGROUP_PATH],
+                    str(Path(config[CONF_PROCFS_PATH]) / "meminfo"),
+                )
+            else:
+                self._cgroup = CgroupStatsReader(config[CONF_CGROUP_PATH])
+        if config[CONF_PROCFS_PATH]:
+            self._procfs = ProcNetReader(config[CONF_PROCFS_PATH])
         self._busy = False
-        self._atInit = atInit
-        self._task: asyncio.Task | None = None
-        self._subscribers: list[Callable] = []
+        self._container: aiodocker.containers.DockerContainer | None = None
+        self._subscribers: dict[Callable, set[str] | None] = {}
+        self._snapshot: tuple | None = None
+        self._polling = False
+        self._cancelled = False
+        self._next_poll = 0.0
+        self._poll_interval: int = self._interval
+        self._backoff = Backoff(self._interval, self._retry_interval)
+        self._idle_ref: tuple | None = None
+        self._idle_count = 0
+        self._stats_stream_task: asyncio.Task | None = None
+        self._stats_frame: dict[str, Any] | None = None
+        self._stats_frame_used: dict[str, Any] | None = None
+        self._list_info: dict[str, Any] | None = None
+        self._list_time = 0.0
+        self._static: dict[str, Any] = {}
+        self._volatile: dict[str, Any] = {}
+        self._inspect_due = False
+        self._inspect_time = 0.0
+        self._event_driven = False
+        self._time_memo: dict[str, datetime] = {}
         self._cpu_old: dict[str, int] = {}
         self._network_old: dict[str, int | datetime] = {}
         self._network_error = 0
@@ -862,28 +2138,32 @@ class DockerContainerAPI:
         self._memory_percent_prev: float | None = None
         self._memory_percent_prev_breach = False
 
-        self._info: dict[str, Any] = {}
-        self._stats: dict[str, Any] = {}
+        self._available = True
 
-    async def init(self):
-        # During start-up we will wait on container attachment,
-        # preventing concurrency issues the main HA loop (we are
-        # othside that one with our threads)
-        if self._atInit:
-            try:
-                self._container = await self._api.containers.get(self._name)
-            except Exception as err:
-                exc_info = True if str(err) == "" else False
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (1) (%s)",
-                    self._instance,
-                    self._name,
-                    str(err),
-                    exc_info=exc_info,
-                )
-                return
+        self._info = ContainerInfo()
+        self._stats = ContainerStats()
+
+    def attach(self, container: aiodocker.containers.DockerContainer) -> None:
+        """Attach to a container of the containers list. The list entry is
+        enough to control the container, the first poll does the inspect.
+        """
+        self._container = container
+        self.set_list_info(container._container)
+
+        # The platforms need these before the first poll
+        entry = container._container
+        self._info.state = entry["State"]
+        self._info.network_available = self._network_available(
+            (entry.get("HostConfig") or {}).get("NetworkMode", "default")
+        )
+
+    #############################################################
+    def _network_available(self, network_mode: str) -> bool:
+        """Check if the network counters are available in this network mode."""
 
-            self._task = asyncio.create_task(self._run())
+        # With procfs we can read the network counters also in host mode
+        no_network = ["none"] if self._procfs is not None else ["host", "none"]
+        return network_mode not in no_network
 
     #############################################################
     async def _initGetContainer(self) -> bool:
@@ -892,7 +2172,8 @@ class DockerContainerAPI:
         # in a running loop.
 
         try:
-            self._container = await self._api.containers.get(self._name)
+            async with self._latency.measure("inspect", self._timeouts["inspect"]):
+                self._container = await self._api.containers.get(self._name)
         except aiodocker.exceptions.DockerError as err:
             _LOGGER.error(
                 "[%s] %s: Container not available anymore (2a) (%s)",
@@ -912,123 +2193,287 @@ class DockerContainerAPI:
             )
             return False
 
-        self._task = asyncio.create_task(self._run())
+        # The attach is a full inspect, the platforms can use it right away
+        self._set_inspect(self._container._container)
+        self._inspect_time = time.monotonic()
+        self._update_info()
 
         return True
 
     #############################################################
-    async def _run(self) -> None:
-        """Loop to gather container info/stats."""
+    @property
+    def name(self) -> str:
+        """Name of the container."""
+        return self._name
 
-        while True:
+    #############################################################
+    @property
+    def polling(self) -> bool:
+        """True while a poll of this container is running."""
+        return self._polling
 
-            sendNotify = True
-            error = True
+    #############################################################
+    def poll_due(self, now: float) -> bool:
+        """Check if the scheduler should poll this container now."""
+        if self._cancelled or self._polling or self._container is None:
+            return False
 
-            try:
-                # Don't check container if we are doing a start/stop
-                if not self._busy:
-                    await self._run_container_info()
+        # Allow some slack, the scheduler visits each container once per interval
+        return now + self._interval / 2 >= self._next_poll
 
-                    # Only run stats if container is running
-                    if self._info[CONTAINER_INFO_STATE] in ("running", "paused"):
-                        await self._run_container_stats()
-                else:
-                    _LOGGER.debug(
-                        "[%s] %s: Waiting on stop/start of container",
-                        self._instance,
-                        self._name,
-                    )
-                    sendNotify = False
+    #############################################################
+    async def poll(self) -> None:
+        """Gather container info/stats once, called by the scheduler of DockerAPI."""
 
-                # No error, so normal interval
-                error = False
+        sendNotify = True
+        error = True
+        self._polling = True
 
-            except concurrent.futures._base.CancelledError:
+        try:
+            # Don't check container if we are doing a start/stop
+            if not self._busy:
+                await self._run_container_info()
+
+                # Only run stats if container is running
+                if self._info.state in ("running", "paused"):
+                    await self._run_container_stats()
+                else:
+                    # Possible we missed the stop/die event
+                    self.stats_stream_stop()
+
+                self._adapt_interval()
+            else:
                 _LOGGER.debug(
-                    "[%s] %s: Container received concurrent.futures._base.CancelledError",
-                    self._instance,
-                    self._name,
-                )
-                pass
-                break
-            except aiodocker.exceptions.DockerError as err:
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3a) (%s). Retry in %d seconds",
-                    self._instance,
-                    self._name,
-                    str(err),
-                    self._retry_interval,
-                )
-            except asyncio.exceptions.CancelledError as err:
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3c) CancelledError. Retry in %d seconds",
+                    "[%s] %s: Waiting on stop/start of container",
                     self._instance,
                     self._name,
-                    self._retry_interval,
-                )
-            except asyncio.TimeoutError as err:
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3d) TimeoutError. Retry in %d seconds",
-                    self._instance,
-                    self._name,
-                    self._retry_interval,
-                )
-            except Exception as err:
-                exc_info = True if str(err) == "" else False
-                _LOGGER.error(
-                    "[%s] %s: Container not available anymore (3b) (%s). Retry in %d seconds",
-                    self._instance,
-                    self._name,
-                    str(err),
-                    self._retry_interval,
-                    exc_info=exc_info,
                 )
+                sendNotify = False
+
+            # No error, so normal interval
+            error = False
+
+        except asyncio.CancelledError:
+            _LOGGER.debug(
+                "[%s] %s: Container received CancelledError",
+                self._instance,
+                self._name,
+            )
+            raise
+        except aiodocker.exceptions.DockerError as err:
+            delay = self._backoff.failure()
+            _LOGGER.error(
+                "[%s] %s: Container not available anymore (3a) (%s). Retry in %d seconds",
+                self._instance,
+                self._name,
+                str(err),
+                delay,
+            )
+        except asyncio.TimeoutError as err:
+            delay = self._backoff.failure()
+            _LOGGER.error(
+                "[%s] %s: Container not available anymore (3d) TimeoutError. Retry in %d seconds",
+                self._instance,
+                self._name,
+                delay,
+            )
+        except Exception as err:
+            delay = self._backoff.failure()
+            exc_info = True if str(err) == "" else False
+            _LOGGER.error(
+                "[%s] %s: Container not available anymore (3b) (%s). Retry in %d seconds",
+                self._instance,
+                self._name,
+                str(err),
+                delay,
+                exc_info=exc_info,
+            )
+        finally:
+            self._polling = False
 
-            # Send values to sensors/switch
-            if sendNotify:
-                self._notify()
+        # Container is removed while we were busy
+        if self._cancelled:
+            return
 
-            # TODO: on error, increase sleep
+        if not error:
+            self._backoff.success()
 
-            # Sleep in normal and exception situation
-            if error:
-                await asyncio.sleep(self._retry_interval)
+        self._info.poll_failures = self._backoff.failures
+
+        # Send values to sensors/switch
+        if sendNotify:
+            self._notify()
+
+        # Determine when the next poll should happen
+        if error:
+            self._next_poll = time.monotonic() + delay
+        else:
+            self._next_poll = time.monotonic() + self._poll_interval
+
+    #############################################################
+    def _adapt_interval(self) -> None:
+        """Determine the poll interval from the state and activity of the
+        container. Stopped containers use the stopped interval, running
+        containers with flat CPU/network values are stretched step by step.
+        """
+
+        state = self._info.state
+
+        if state in ("exited", "created", "dead"):
+            # A start is noticed by the events (or the next poll)
+            self._idle_ref = None
+            self._idle_count = 0
+            self._poll_interval = max(self._interval, self._stopped_interval)
+        elif state != "running" or self._idle_interval <= self._interval:
+            self.reset_interval()
+        else:
+            values = (
+                self._stats.cpu_percentage or 0,
+                self._stats.network_speed_up or 0,
+                self._stats.network_speed_down or 0,
+            )
+
+            # A change past the threshold snaps back to the normal interval
+            if self._idle_ref is None or any(
+                abs(value - ref) > self._idle_threshold
+                for value, ref in zip(values, self._idle_ref)
+            ):
+                self.reset_interval()
+                self._idle_ref = values
             else:
-                await asyncio.sleep(self._interval)
+                self._idle_count += 1
+                if self._idle_count >= IDLE_POLLS:
+                    self._idle_count = 0
+                    self._poll_interval = min(
+                        self._poll_interval * 2, self._idle_interval
+                    )
+
+        self._info.poll_interval = self._poll_interval
+
+    #############################################################
+    def reset_interval(self) -> None:
+        """Back to the normal poll interval."""
+        self._poll_interval = self._interval
+        self._idle_ref = None
+        self._idle_count = 0
 
     #############################################################
     async def _run_container_info(self) -> None:
-        """Get container information, but we can not get
-        the uptime of this container, that is only available
-        while listing all containers :-(.
+        """Get container information. A full inspect is only done if the
+        static attributes are not cached yet, or if the volatile attributes
+        can not be delivered by the Docker events or the containers list.
+        """
+
+        now = time.monotonic()
+
+        if self._inspect_needed(now):
+            async with self._latency.measure("inspect", self._timeouts["inspect"]):
+                raw: dict = await self._container.show()
+            self._set_inspect(raw)
+            self._inspect_time = now
+        elif not self._event_driven:
+            # The state is refreshed by the containers list
+            self._set_list(self._list_info)
+
+        self._update_info()
+
+    #############################################################
+    def _inspect_needed(self, now: float) -> bool:
+        """Check if we need a full inspect of the container."""
+
+        if not self._static or self._inspect_due:
+            return True
+
+        # Reconcile with an inspect once in a while
+        if now - self._inspect_time >= self._reconcile_interval:
+            return True
+
+        # The state is kept up-to-date by the Docker events
+        if self._event_driven:
+            return False
+
+        # The list only has the state and health, a changed state needs the
+        # timestamps and exit code of an inspect
+        entry = self._list_info
+        return not (
+            self._bulk_refresh
+            and entry is not None
+            and now - self._list_time <= 2 * self._interval
+            and entry.get("Id") == self._container.id
+            and entry.get("State") == self._volatile["state"]
+        )
+
+    #############################################################
+    def _set_inspect(self, raw: dict[str, Any]) -> None:
+        """Store the static and volatile attributes of an inspect."""
+
+        state: dict[str, Any] = raw["State"]
+
+        # These only change with a (re)start or recreate of the container
+        self._static = {
+            CONTAINER_INFO_IMAGE: raw["Config"]["Image"],
+            CONTAINER_INFO_IMAGE_HASH: raw["Image"],
+            "network_mode": raw["HostConfig"]["NetworkMode"],
+            "created": self._parse_time(raw["Created"]),
+            "started_at": self._parse_time(state["StartedAt"]),
+            "pid": state.get("Pid", 0),
+        }
+
+        self._volatile = {
+            "state": state["Status"],
+            "health": (state.get("Health") or {}).get("Status", "unknown"),
+            "exit_code": state.get("ExitCode"),
+            "finished_at": self._parse_time(state["FinishedAt"]),
+        }
+
+        self._inspect_due = False
+
+    #############################################################
+    def _set_list(self, entry: dict[str, Any]) -> None:
+        """Store the volatile attributes of a containers list entry."""
+
+        self._volatile["state"] = entry["State"]
+
+        # The list only has the health inside the status text
+        match = _LIST_HEALTH.search(entry.get("Status") or "")
+        if match:
+            self._volatile["health"] = match.group(1).replace("health: ", "")
+
+    #############################################################
+    @property
+    def container_id(self) -> str | None:
+        """Id of the attached container."""
+        return self._container.id if self._container is not None else None
+
+    #############################################################
+    def invalidate_static(self) -> None:
+        """The static attributes are outdated, refresh them with an inspect
+        during the next poll. Until then the cached values are used.
         """
+        self._inspect_due = True
 
-        self._info = {}
+    #############################################################
+    def _update_info(self) -> None:
+        """Update the container info from the static and volatile attributes."""
 
-        raw: dict = await self._container.show()
+        info = self._info
 
-        self._info[CONTAINER_INFO_STATE] = raw["State"]["Status"]
-        self._info[CONTAINER_INFO_IMAGE] = raw["Config"]["Image"]
-        self._info[CONTAINER_INFO_IMAGE_HASH] = raw["Image"]
+        info.state = self._volatile["state"]
+        info.poll_interval = self._poll_interval
+        info.poll_failures = self._backoff.failures
+        info.image = self._static[CONTAINER_INFO_IMAGE]
+        info.image_hash = self._static[CONTAINER_INFO_IMAGE_HASH]
 
         if self._network_error <= 5:
-            if CONTAINER_INFO_NETWORK_AVAILABLE not in self._info:
-                self._info[CONTAINER_INFO_NETWORK_AVAILABLE] = (
-                    False
-                    if raw["HostConfig"]["NetworkMode"] in ["host", "none"]
-                    else True
-                )
+            info.network_available = self._network_available(
+                self._static["network_mode"]
+            )
         else:
-            self._info[CONTAINER_INFO_NETWORK_AVAILABLE] = False
+            info.network_available = False
 
-        try:
-            self._info[CONTAINER_INFO_HEALTH] = raw["State"]["Health"]["Status"]
-        except:
-            self._info[CONTAINER_INFO_HEALTH] = "unknown"
+        info.health = self._volatile["health"]
 
-        # We only do a calculation of startedAt, because we use it twice
-        startedAt = parser.parse(raw["State"]["StartedAt"])
+        startedAt: datetime = self._static["started_at"]
 
         # Determine the container status in the format:
         # Up 6 days
@@ -1036,61 +2481,170 @@ class DockerContainerAPI:
         # Exited (0) 2 months ago
         # Restarting (99) 5 seconds ago
 
-        if self._info[CONTAINER_INFO_STATE] == "running":
-            self._info[CONTAINER_INFO_STATUS] = "Up {}".format(
-                self._calcdockerformat(startedAt)
-            )
-        elif self._info[CONTAINER_INFO_STATE] == "exited":
-            self._info[CONTAINER_INFO_STATUS] = "Exited ({}) {} ago".format(
-                raw["State"]["ExitCode"],
-                self._calcdockerformat(parser.parse(raw["State"]["FinishedAt"])),
-            )
-        elif self._info[CONTAINER_INFO_STATE] == "created":
-            self._info[CONTAINER_INFO_STATUS] = "Created {} ago".format(
-                self._calcdockerformat(parser.parse(raw["Created"]))
+        if info.state == "running":
+            info.status = "Up {}".format(self._calcdockerformat(startedAt))
+        elif info.state == "exited":
+            info.status = "Exited ({}) {} ago".format(
+                self._volatile["exit_code"],
+                self._calcdockerformat(self._volatile["finished_at"]),
             )
-        elif self._info[CONTAINER_INFO_STATE] == "restarting":
-            self._info[CONTAINER_INFO_STATUS] = "Restarting"
-        elif self._info[CONTAINER_INFO_STATE] == "paused":
-            self._info[CONTAINER_INFO_STATUS] = "Up {} (Paused)".format(
-                self._calcdockerformat(startedAt)
+        elif info.state == "created":
+            info.status = "Created {} ago".format(
+                self._calcdockerformat(self._static["created"])
             )
+        elif info.state == "restarting":
+            info.status = "Restarting"
+        elif info.state == "paused":
+            info.status = "Up {} (Paused)".format(self._calcdockerformat(startedAt))
         else:
-            self._info[CONTAINER_INFO_STATUS] = "None ({})".format(
-                raw["State"]["Status"]
-            )
+            info.status = "None ({})".format(info.state)
 
-        if self._info[CONTAINER_INFO_STATE] in ("running", "paused"):
-            self._info[CONTAINER_INFO_UPTIME] = dt_util.as_local(startedAt).isoformat()
+        if info.state in ("running", "paused"):
+            info.uptime = dt_util.as_local(startedAt).isoformat()
         else:
-            self._info[CONTAINER_INFO_UPTIME] = None
+            info.uptime = None
             _LOGGER.debug(
                 "[%s] %s: %s",
                 self._instance,
                 self._name,
-                self._info[CONTAINER_INFO_STATUS],
+                info.status,
             )
 
     #############################################################
-    async def _run_container_stats(self) -> None:
-        # Initialize stats information
-        stats: dict[str, Any] = {}
-        stats["cpu"] = {}
-        stats["memory"] = {}
-        stats["network"] = {}
-        stats["read"] = {}
-        stats["disk"] = {}
-
-        # Get container stats, only interested in [0]
-        rawarr = await self._container.stats(stream=False)
-
-        # Could be out-of-range when stopping/renaming
-        try:
-            raw: dict[str, Any] = rawarr[0]
-        except IndexError:
+    def _parse_time(self, value: str) -> datetime:
+        """Parse a timestamp of the inspect, these rarely change thus
+        an unchanged timestamp is never parsed again.
+        """
+        result = self._time_memo.get(value)
+
+        if result is None:
+            # Only a few timestamps per container, keep the memo small
+            if len(self._time_memo) >= 8:
+                self._time_memo.clear()
+
+            result = parse_docker_time(value)
+            self._time_memo[value] = result
+
+        return result
+
+    #############################################################
+    def set_event_driven(self, active: bool) -> None:
+        """Enable/disable maintaining the state with the Docker events."""
+        self._event_driven = active
+
+    #############################################################
+    def apply_event(self, event: dict[str, Any]) -> None:
+        """Update the container state with a Docker event and notify directly."""
+
+        action: str = event["Action"]
+
+        # Open/close the stats stream, if streaming is enabled
+        if action in ["start", "restart", "unpause"]:
+            self.stats_stream_start()
+        elif action in ["stop", "die"]:
+            self.stats_stream_stop()
+
+        # We need a first inspect, before we can apply the events on it
+        if not self._static:
+            return
+
+        # Determine event time, in nanoseconds
+        if "timeNano" in event:
+            timestamp = datetime.fromtimestamp(
+                event["timeNano"] / 1000000000, timezone.utc
+            )
+        else:
+            timestamp = datetime.now(timezone.utc)
+
+        if action in ["start", "restart"]:
+            self._volatile["state"] = "running"
+
+            # New process, use the event until the next inspect refreshes it
+            self.invalidate_static()
+            self._static["started_at"] = timestamp
+            self._static["pid"] = 0
+        elif action == "die":
+            self._volatile["state"] = "exited"
+            self._volatile["finished_at"] = timestamp
+            self._static["pid"] = 0
+            try:
+                self._volatile["exit_code"] = int(
+                    event["Actor"]["Attributes"]["exitCode"]
+                )
+            except (KeyError, ValueError):
+                pass
+        elif action == "stop":
+            self._volatile["state"] = "exited"
+        elif action == "pause":
+            self._volatile["state"] = "paused"
+        elif action == "unpause":
+            self._volatile["state"] = "running"
+        elif action.startswith("health_status"):
+            # Format is "health_status: healthy"
+            self._volatile["health"] = action.split(":", 1)[-1].strip()
+        else:
             return
 
-        stats["read"] = parser.parse(raw["read"])
+        _LOGGER.debug(
+            "[%s] %s: Event %s applied on state", self._instance, self._name, action
+        )
+
+        # Something happened, poll again with the normal interval
+        self.reset_interval()
+        self._next_poll = min(self._next_poll, time.monotonic() + self._interval)
+
+        self._update_info()
+        self._notify()
+
+    #############################################################
+    def set_list_info(self, entry: dict[str, Any]) -> None:
+        """Store the entry of this container from the containers list."""
+        self._list_info = entry
+        self._list_time = time.monotonic()
+
+    #############################################################
+    async def _run_container_stats(self) -> None:
+        # Try to read the stats directly from the cgroup filesystem first
+        raw: dict[str, Any] | None = None
+        if self._cgroup is not None:
+            raw = await asyncio.get_running_loop().run_in_executor(
+                None, self._cgroup.read_stats, self._container.id
+            )
+        from_cgroup = raw is not None
+
+        if from_cgroup:
+            # Keep the Docker API out of it, cgroup is available
+            self.stats_stream_stop()
+        elif self._stats_stream:
+            # (Re)open stream if not running, e.g. at startup or we missed the start event
+            self.stats_stream_start()
+
+            # Use the newest frame of the stream, but never the same one twice
+            raw = self._stats_frame
+            if raw is None or raw is self._stats_frame_used:
+                return
+
+            self._stats_frame_used = raw
+        else:
+            # Get container stats, only interested in [0]
+            async with self._latency.measure("stats", self._timeouts["stats"]):
+                rawarr = await self._container.stats(stream=False)
+
+            # Could be out-of-range when stopping/renaming
+            try:
+                raw = rawarr[0]
+            except IndexError:
+                return
+
+        # Network counters from procfs are cheaper and also work in host mode
+        if self._procfs is not None and self._static.get("pid"):
+            networks = await asyncio.get_running_loop().run_in_executor(
+                None, self._procfs.read_networks, self._static["pid"]
+            )
+            if networks is not None:
+                raw = {**raw, "networks": networks}
+
+        read = parse_docker_time(raw["read"])
 
         # Gather CPU information
         cpu_stats = {}
@@ -1280,7 +2834,10 @@ class DockerContainerAPI:
 
         # Gather network information, doesn't work in network=host mode
         network_stats: dict[str, int | float] = {}
-        if self._info[CONTAINER_INFO_NETWORK_AVAILABLE]:
+        # The cgroup filesystem has no network counters
+        if self._info.network_available and (
+            not from_cgroup or "networks" in raw
+        ):
             try:
                 network_new = {}
                 network_stats["total_tx"] = 0
@@ -1290,7 +2847,7 @@ class DockerContainerAPI:
                     network_stats["total_rx"] += data["rx_bytes"]
 
                 network_new = {
-                    "read": stats["read"],
+                    "read": read,
                     "total_tx": network_stats["total_tx"],
                     "total_rx": network_stats["total_rx"],
                 }
@@ -1370,72 +2927,132 @@ class DockerContainerAPI:
                         self._instance,
                         self._name,
                     )
-                    self._info[CONTAINER_INFO_NETWORK_AVAILABLE] = False
-
-        # Gather disk information
-        disk_stats: dict[str, float | None] = {}
-
-        try:
-            disk_stats["read"] = None
-            disk_stats["write"] = None
+                    self._info.network_available = False
 
-            if (
-                "blkio_stats" in raw
-                and "io_service_bytes_recursive" in raw["blkio_stats"]
-            ):
-                for xarr in raw["blkio_stats"]["io_service_bytes_recursive"]:
-                    if "op" in xarr and xarr["op"] == "read":
-                        disk_stats["read"] = toMB(
-                            xarr["value"], self._config[CONF_PRECISION_DISK_MB]
-                        )
-                    if "op" in xarr and xarr["op"] == "write":
-                        disk_stats["write"] = toMB(
-                            xarr["value"], self._config[CONF_PRECISION_DISK_MB]
-                        )
+        # All information collected, update the record in place
+        stats = self._stats
+        stats.read = read
 
-        except Exception as err:
-            #_LOGGER.error( "[%s] %s: Can not determine disk usage for container (%s)", self._instance, self._name, str(err),)
-            # Seems if no disk read/write is done, we get NoneType here
-            disk_stats["read"] = None
-            disk_stats["write"] = None
-
-        # All information collected
-        stats["cpu"] = cpu_stats
-        stats["memory"] = memory_stats
-        stats["network"] = network_stats
-        stats["disk"] = disk_stats
-
-        stats[CONTAINER_STATS_CPU_PERCENTAGE] = cpu_stats.get("total")
+        stats.cpu_percentage = cpu_stats.get("total")
+        stats.cpu1_percentage = None
         if "online_cpus" in cpu_stats and cpu_stats.get("total") is not None:
-            stats[CONTAINER_STATS_1CPU_PERCENTAGE] = round(
+            stats.cpu1_percentage = round(
                 cpu_stats.get("total") / cpu_stats["online_cpus"],
                 self._config[CONF_PRECISION_CPU],
             )
 
-        stats[CONTAINER_STATS_MEMORY] = memory_stats.get("usage")
-        stats[CONTAINER_STATS_MEMORY_PERCENTAGE] = memory_stats.get("usage_percent")
-        stats[CONTAINER_STATS_NETWORK_SPEED_UP] = network_stats.get("speed_tx")
-        stats[CONTAINER_STATS_NETWORK_SPEED_DOWN] = network_stats.get("speed_rx")
-        stats[CONTAINER_STATS_NETWORK_TOTAL_UP] = network_stats.get("total_tx")
-        stats[CONTAINER_STATS_NETWORK_TOTAL_DOWN] = network_stats.get("total_rx")
+        stats.memory = memory_stats.get("usage")
+        stats.memory_percentage = memory_stats.get("usage_percent")
+        stats.network_speed_up = network_stats.get("speed_tx")
+        stats.network_speed_down = network_stats.get("speed_rx")
+        stats.network_total_up = network_stats.get("total_tx")
+        stats.network_total_down = network_stats.get("total_rx")
+
+    #############################################################
+    def stats_stream_start(self) -> None:
+        """Open the long-lived stats stream, if streaming is enabled."""
+        if not self._stats_stream or self._container is None:
+            return
+
+        if self._stats_stream_task is not None and not self._stats_stream_task.done():
+            return
 
-        self._stats = stats
+        _LOGGER.debug("[%s] %s: Opening stats stream", self._instance, self._name)
+        self._stats_stream_task = asyncio.create_task(self._run_stats_stream())
 
     #############################################################
-    def cancel_task(self) -> None:
-        if self._task is not None:
-            _LOGGER.info(
-                "[%s] %s: Cancelling task for container info/stats",
+    def stats_stream_stop(self) -> None:
+        """Close the stats stream and forget the last frame."""
+        if self._stats_stream_task is not None:
+            _LOGGER.debug("[%s] %s: Closing stats stream", self._instance, self._name)
+            self._stats_stream_task.cancel()
+            self._stats_stream_task = None
+
+        self._stats_frame = None
+        self._stats_frame_used = None
+
+    #############################################################
+    async def _run_stats_stream(self) -> None:
+        """Read the stats stream, only the newest frame is kept."""
+
+        # The streams have their own connection pool, if available
+        container = self._container
+        if self._stream_api is not None:
+            container = self._stream_api.containers.container(self._container.id)
+
+        try:
+            async for raw in container.stats(stream=True):
+                self._stats_frame = raw
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            exc_info = True if str(err) == "" else False
+            _LOGGER.error(
+                "[%s] %s: Stats stream failed (%s)",
                 self._instance,
                 self._name,
+                str(err),
+                exc_info=exc_info,
             )
-            self._task.cancel()
+
+        _LOGGER.debug("[%s] %s: Stats stream ended", self._instance, self._name)
+
+    #############################################################
+    async def rebind(self) -> bool:
+        """Attach to the new container with our name, after a recreate. The
+        entities stay, the counters of the old container are dropped.
+        """
+
+        self.stats_stream_stop()
+        self._cpu_old = {}
+        self._network_old = {}
+        self._stats_frame = None
+        self._stats_frame_used = None
+        self._list_info = None
+        self._time_memo = {}
+        self._backoff.success()
+        self.reset_interval()
+        self._next_poll = 0.0
+
+        if not await self._initGetContainer():
+            return False
+
+        self._notify()
+        return True
+
+    #############################################################
+    @property
+    def available(self) -> bool:
+        """False while the Docker daemon is disconnected."""
+        return self._available
+
+    #############################################################
+    def set_available(self, available: bool) -> None:
+        """Mark the entities (un)available. While the daemon is disconnected
+        nothing is polled, after the reconnect the next poll is right away.
+        """
+
+        self._available = available
+
+        if available:
+            self._next_poll = 0.0
         else:
-            _LOGGER.info(
-                "[%s] %s: Task (not running) can not be cancelled for container info/stats",
-                self._instance,
-                self._name,
-            )
+            self.stats_stream_stop()
+
+        for callback in list(self._subscribers):
+            callback()
+
+    #############################################################
+    def cancel_task(self) -> None:
+        """Stop polling of this container by the scheduler."""
+        _LOGGER.info(
+            "[%s] %s: Cancelling polling for container info/stats",
+            self._instance,
+            self._name,
+        )
+
+        self._cancelled = True
+        self.stats_stream_stop()
 
     #############################################################
     def rename_entities_containername(self) -> None:
@@ -1457,7 +3074,7 @@ class DockerContainerAPI:
         for callback in self._subscribers:
             callback(remove=True)
 
-        self._subscriber: list[Callable] = []
+        self._subscribers = {}
 
     #############################################################
     async def _start(self) -> None:
@@ -1537,6 +3154,12 @@ class DockerContainerAPI:
         self._busy = True
         await self._restart()
 
+    #############################################################
+    @property
+    def failures(self) -> int:
+        """Number of polls failed in a row."""
+        return self._backoff.failures
+
     #############################################################
     def get_name(self) -> str:
         """Return the container name."""
@@ -1548,18 +3171,22 @@ class DockerContainerAPI:
         self._name = name
 
     #############################################################
-    def get_info(self) -> dict:
+    def get_info(self) -> ContainerInfo:
         """Return the container info."""
         return self._info
 
     #############################################################
-    def get_stats(self) -> dict:
+    def get_stats(self) -> ContainerStats:
         """Return the container stats."""
         return self._stats
 
     #############################################################
-    def register_callback(self, callback: Callable, variable: str):
-        """Register callback from sensor/switch/button."""
+    def register_callback(
+        self, callback: Callable, variable: str, keys: list[str] | None = None
+    ):
+        """Register callback from sensor/switch/button. The callback is only
+        called if one of the keys changed, or always if no keys are given.
+        """
         if callback not in self._subscribers:
             _LOGGER.debug(
                 "[%s] %s: Added callback to container, entity: %s",
@@ -1567,19 +3194,50 @@ class DockerContainerAPI:
                 self._name,
                 variable,
             )
-            self._subscribers.append(callback)
+            self._subscribers[callback] = None if keys is None else set(keys)
 
     #############################################################
     def _notify(self) -> None:
-        if len(self._subscribers) > 0:
+        """Notify the subscribers of the info/stats keys which changed."""
+
+        snapshot = self._info.values() + self._stats.values()
+        if self._snapshot is None:
+            changed = set(_SNAPSHOT_KEYS)
+        else:
+            changed = {
+                key
+                for key, new, old in zip(_SNAPSHOT_KEYS, snapshot, self._snapshot)
+                if new != old
+            }
+        self._snapshot = snapshot
+
+        # Report our share of the host totals, only if it changed
+        if self._on_totals is not None and not changed.isdisjoint(_TOTALS_KEYS):
+            if self._info.state == "running":
+                self._on_totals(
+                    self._name,
+                    self._stats.cpu_percentage or 0.0,
+                    self._stats.memory or 0.0,
+                )
+            else:
+                self._on_totals(self._name, 0.0, 0.0)
+
+        callbacks = [
+            callback
+            for callback, keys in self._subscribers.items()
+            if keys is None or not keys.isdisjoint(changed)
+        ]
+
+        if len(callbacks) > 0:
             _LOGGER.debug(
-                "[%s] %s: Send notify (%d) to container",
+                "[%s] %s: Send notify (%d/%d) to container",
                 self._instance,
                 self._name,
+                len(callbacks),
                 len(self._subscribers),
             )
 
-        for callback in self._subscribers:
+        for callback in callbacks:
             callback()
 
     #############################################################
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import re
+import time
 from datetime import datetime
 from typing import Any
 
@@ -12,8 +13,10 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
 )
 from homeassistant.const import CONF_MONITORED_CONDITIONS, CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import slugify
 
@@ -21,18 +24,29 @@ from .const import (
     API,
     ATTR_MEMORY_LIMIT,
     ATTR_ONLINE_CPUS,
+    ATTR_BACKOFF,
+    ATTR_CONNECTION_POOL,
+    ATTR_LATENCY,
+    ATTR_POLL_CYCLE_DURATION,
+    ATTR_POLL_FAILURES,
+    ATTR_POLL_INTERVAL,
+    ATTR_POLL_QUEUE_DEPTH,
     ATTR_VERSION_ARCH,
     ATTR_VERSION_KERNEL,
     ATTR_VERSION_OS,
     ATTR_VERSION_OS_TYPE,
     CONF_CONTAINERS,
     CONF_CONTAINERS_EXCLUDE,
+    CONF_DEADBAND,
+    CONF_DIAGNOSTICS,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
     CONF_PREFIX,
     CONF_RENAME,
     CONF_RENAME_ENITITY,
     CONF_SENSORNAME,
+    CONF_SENSOR_FILTERS,
     CONFIG,
-    CONTAINER,
     CONTAINER_INFO_ALLINONE,
     CONTAINER_INFO_HEALTH,
     CONTAINER_INFO_IMAGE,
@@ -44,8 +58,10 @@ from .const import (
     CONTAINER_MONITOR_LIST,
     CONTAINER_MONITOR_NETWORK_LIST,
     DOCKER_INFO_VERSION,
+    DIAGNOSTIC_MONITOR_LIST,
     DOCKER_MONITOR_LIST,
     DOMAIN,
+    SIGNAL_CONTAINERS_ADDED,
 )
 from .helpers import DockerAPI, DockerContainerAPI
 
@@ -87,113 +103,138 @@ async def async_setup_platform(
         DockerSensor(api, instance, prefix, DOCKER_MONITOR_LIST[variable])
         for variable in config[CONF_MONITORED_CONDITIONS]
         if variable in DOCKER_MONITOR_LIST
-        if CONTAINER not in discovery_info
     ]
 
-    # We support add/re-add of a container
-    if CONTAINER in discovery_info:
-        clist = [discovery_info[CONTAINER]]
-    else:
-        clist = api.list_containers()
-
-    allinone = False
-    stateremoved = False
-
-    # Detect allinone
-    if CONTAINER_INFO_ALLINONE in config[CONF_MONITORED_CONDITIONS]:
-        allinone = True
-        config[CONF_MONITORED_CONDITIONS].remove(CONTAINER_INFO_ALLINONE)
-        if CONTAINER_INFO_STATE in config[CONF_MONITORED_CONDITIONS]:
-            stateremoved = True
-            config[CONF_MONITORED_CONDITIONS].remove(CONTAINER_INFO_STATE)
-
-    for cname in clist:
-        includeContainer = False
-        if cname in config[CONF_CONTAINERS] or not config[CONF_CONTAINERS]:
-            includeContainer = True
-
-        if config[CONF_CONTAINERS_EXCLUDE] and cname in config[CONF_CONTAINERS_EXCLUDE]:
-            includeContainer = False
+    # Optional latency/cycle duration sensors of this instance
+    if config[CONF_DIAGNOSTICS]:
+        sensors += [
+            DockerSensor(api, instance, prefix, description)
+            for description in DIAGNOSTIC_MONITOR_LIST.values()
+        ]
 
-        if includeContainer:
-            # Try to figure out if we should include any network sensors
-            capi = api.get_container(cname)
-            info = capi.get_info()
-            network_available = info.get(CONTAINER_INFO_NETWORK_AVAILABLE)
-            if network_available is None:
-                _LOGGER.error(
-                    "[%s] %s: Cannot determine network-available?", instance, cname
-                )
-                network_available = False
-
-            _LOGGER.debug("[%s] %s: Adding component Sensor(s)", instance, cname)
-
-            if allinone:
-                monitor_conditions = []
-                for variable in config[CONF_MONITORED_CONDITIONS]:
-                    if variable in CONTAINER_MONITOR_LIST and (
-                        network_available
-                        or (
-                            not network_available
-                            and variable not in CONTAINER_MONITOR_NETWORK_LIST
-                        )
-                    ):
-                        monitor_conditions += [variable]
-
-                # Only force rename of entityid is requested, to not break backwards compatibility
-                alias_entityid = cname
-                if config[CONF_RENAME_ENITITY]:
-                    alias_entityid = find_rename(config[CONF_RENAME], cname)
-
-                sensors += [
-                    DockerContainerSensor(
-                        capi,
-                        instance=instance,
-                        prefix=prefix,
-                        cname=cname,
-                        alias_entityid=alias_entityid,
-                        alias_name=find_rename(config[CONF_RENAME], cname),
-                        description=CONTAINER_MONITOR_LIST[CONTAINER_INFO_ALLINONE],
-                        sensor_name_format=config[CONF_SENSORNAME],
-                        condition_list=monitor_conditions,
+    @callback
+    def add_containers(clist: list[str]) -> None:
+        """Add the sensors of a batch of containers."""
+
+        sensors: list[DockerContainerSensor] = []
+
+        allinone = False
+        stateremoved = False
+
+        # Detect allinone
+        if CONTAINER_INFO_ALLINONE in config[CONF_MONITORED_CONDITIONS]:
+            allinone = True
+            config[CONF_MONITORED_CONDITIONS].remove(CONTAINER_INFO_ALLINONE)
+            if CONTAINER_INFO_STATE in config[CONF_MONITORED_CONDITIONS]:
+                stateremoved = True
+                config[CONF_MONITORED_CONDITIONS].remove(CONTAINER_INFO_STATE)
+
+        for cname in clist:
+            includeContainer = False
+            if cname in config[CONF_CONTAINERS] or not config[CONF_CONTAINERS]:
+                includeContainer = True
+
+            if (
+                config[CONF_CONTAINERS_EXCLUDE]
+                and cname in config[CONF_CONTAINERS_EXCLUDE]
+            ):
+                includeContainer = False
+
+            if includeContainer:
+                # Try to figure out if we should include any network sensors
+                capi = api.get_container(cname)
+                info = capi.get_info()
+                network_available = info.get(CONTAINER_INFO_NETWORK_AVAILABLE)
+                if network_available is None:
+                    _LOGGER.error(
+                        "[%s] %s: Cannot determine network-available?",
+                        instance,
+                        cname,
                     )
-                ]
-            else:
-                for variable in config[CONF_MONITORED_CONDITIONS]:
-                    if variable in CONTAINER_MONITOR_LIST and (
-                        network_available
-                        or (
-                            not network_available
-                            and variable not in CONTAINER_MONITOR_NETWORK_LIST
+                    network_available = False
+
+                _LOGGER.debug("[%s] %s: Adding component Sensor(s)", instance, cname)
+
+                if allinone:
+                    monitor_conditions = []
+                    for variable in config[CONF_MONITORED_CONDITIONS]:
+                        if variable in CONTAINER_MONITOR_LIST and (
+                            network_available
+                            or (
+                                not network_available
+                                and variable not in CONTAINER_MONITOR_NETWORK_LIST
+                            )
+                        ):
+                            monitor_conditions += [variable]
+
+                    # Only force rename of entityid is requested, to not break backwards compatibility
+                    alias_entityid = cname
+                    if config[CONF_RENAME_ENITITY]:
+                        alias_entityid = find_rename(config[CONF_RENAME], cname)
+
+                    sensors += [
+                        DockerContainerSensor(
+                            capi,
+                            instance=instance,
+                            prefix=prefix,
+                            cname=cname,
+                            alias_entityid=alias_entityid,
+                            alias_name=find_rename(config[CONF_RENAME], cname),
+                            description=CONTAINER_MONITOR_LIST[CONTAINER_INFO_ALLINONE],
+                            sensor_name_format=config[CONF_SENSORNAME],
+                            condition_list=monitor_conditions,
                         )
-                    ):
-
-                        # Only force rename of entityid is requested, to not break backwards compatibility
-                        alias_entityid = cname
-                        if config[CONF_RENAME_ENITITY]:
-                            alias_entityid = find_rename(config[CONF_RENAME], cname)
-
-                        sensors += [
-                            DockerContainerSensor(
-                                capi,
-                                instance=instance,
-                                prefix=prefix,
-                                cname=cname,
-                                alias_entityid=alias_entityid,
-                                alias_name=find_rename(config[CONF_RENAME], cname),
-                                description=CONTAINER_MONITOR_LIST[variable],
-                                sensor_name_format=config[CONF_SENSORNAME],
+                    ]
+                else:
+                    for variable in config[CONF_MONITORED_CONDITIONS]:
+                        if variable in CONTAINER_MONITOR_LIST and (
+                            network_available
+                            or (
+                                not network_available
+                                and variable not in CONTAINER_MONITOR_NETWORK_LIST
                             )
-                        ]
-
-    # Restore state, required for destroy/create container
-    if allinone:
-        config[CONF_MONITORED_CONDITIONS].append(CONTAINER_INFO_ALLINONE)
-    if stateremoved:
-        config[CONF_MONITORED_CONDITIONS].append(CONTAINER_INFO_STATE)
+                        ):
+
+                            # Only force rename of entityid is requested, to not break backwards compatibility
+                            alias_entityid = cname
+                            if config[CONF_RENAME_ENITITY]:
+                                alias_entityid = find_rename(config[CONF_RENAME], cname)
+
+                            sensors += [
+                                DockerContainerSensor(
+                                    capi,
+                                    instance=instance,
+                                    prefix=prefix,
+                                    cname=cname,
+                                    alias_entityid=alias_entityid,
+                                    alias_name=find_rename(config[CONF_RENAME], cname),
+                                    description=CONTAINER_MONITOR_LIST[variable],
+                                    sensor_name_format=config[CONF_SENSORNAME],
+                                    sensor_filter=config[CONF_SENSOR_FILTERS].get(
+                                        variable
+                                    ),
+                                )
+                            ]
+
+        # Restore state, required for destroy/create container
+        if allinone:
+            config[CONF_MONITORED_CONDITIONS].append(CONTAINER_INFO_ALLINONE)
+        if stateremoved:
+            config[CONF_MONITORED_CONDITIONS].append(CONTAINER_INFO_STATE)
+
+        if sensors:
+            async_add_entities(sensors, True)
 
     async_add_entities(sensors, True)
 
+    # Containers created later on are added in batches by the DockerAPI
+    add_containers(list(api.list_containers()))
+    api.register_dispatcher(
+        async_dispatcher_connect(
+            hass, SIGNAL_CONTAINERS_ADDED.format(instance), add_containers
+        )
+    )
+
     return True
 
 
@@ -255,6 +296,17 @@ class DockerSensor(SensorEntity):
             self._attributes[ATTR_VERSION_OS] = info.get(ATTR_VERSION_OS)
             self._attributes[ATTR_VERSION_OS_TYPE] = info.get(ATTR_VERSION_OS_TYPE)
             self._attributes[ATTR_VERSION_KERNEL] = info.get(ATTR_VERSION_KERNEL)
+            self._attributes[ATTR_POLL_CYCLE_DURATION] = info.get(
+                ATTR_POLL_CYCLE_DURATION
+            )
+            self._attributes[ATTR_POLL_QUEUE_DEPTH] = info.get(ATTR_POLL_QUEUE_DEPTH)
+            self._attributes[ATTR_BACKOFF] = info.get(ATTR_BACKOFF)
+            self._attributes[ATTR_CONNECTION_POOL] = info.get(ATTR_CONNECTION_POOL)
+        elif self.entity_description.key in DIAGNOSTIC_MONITOR_LIST:
+            self._state = info.get(self.entity_description.key)
+            self._attributes = info.get(ATTR_LATENCY, {}).get(
+                self.entity_description.key, {}
+            )
         else:
             self._state = info.get(self.entity_description.key)
 
@@ -263,17 +315,30 @@ class DockerSensor(SensorEntity):
         """Return the state attributes."""
         return self._attributes
 
+    @property
+    def should_poll(self) -> bool:
+        return False
+
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
         self._api.register_callback(self.event_callback, self.entity_description.key)
 
     def event_callback(self, remove=False) -> None:
-        """Callback to remove Docker entity."""
+        """Callback for update of the Docker information, or removal."""
 
         # If already called before, do not remove it again
         if self._removed:
             return
 
+        if not remove:
+            # Only write if something changed, we get called for every update
+            previous = (self._state, dict(self._attributes), self._attr_available)
+            self.update()
+            self._attr_available = self._api.available
+            if (self._state, self._attributes, self._attr_available) != previous:
+                self.async_write_ha_state()
+            return
+
         if remove:
             _LOGGER.info(
                 "[%s]: Removing sensor entity: %s",
@@ -300,6 +365,7 @@ class DockerContainerSensor(SensorEntity):
         description: SensorEntityDescription,
         sensor_name_format: str,
         condition_list: list | None = None,
+        sensor_filter: dict[str, Any] | None = None,
     ):
         """Initialize the sensor."""
 
@@ -308,6 +374,11 @@ class DockerContainerSensor(SensorEntity):
         self._prefix = prefix
         self._cname = cname
         self._condition_list = condition_list
+        self._sensor_filter = sensor_filter
+        self._last_write = 0.0
+        self._pending_state = None
+        self._pending_due = 0.0
+        self._unsub_pending = None
 
         self.entity_description = description
 
@@ -381,13 +452,108 @@ class DockerContainerSensor(SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
+        # Only get called if one of our values changed, the state is always
+        # needed because all other values depend on it
+        keys = [CONTAINER_INFO_STATE, self.entity_description.key]
+        keys += self._condition_list or []
+
+        # Only the state sensors show the poll interval and failures
+        if self.entity_description.key in [
+            CONTAINER_INFO_ALLINONE,
+            CONTAINER_INFO_STATE,
+        ]:
+            keys += [ATTR_POLL_INTERVAL, ATTR_POLL_FAILURES]
+
         self._container.register_callback(
-            self.event_callback, self.entity_description.key
+            self.event_callback, self.entity_description.key, keys
         )
 
         # Call event callback for possible information available
         self.event_callback()
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a postponed state write."""
+        self._cancel_pending()
+
+    def _cancel_pending(self) -> None:
+        """Cancel a postponed state write."""
+        if self._unsub_pending is not None:
+            self._unsub_pending()
+            self._unsub_pending = None
+
+    def _schedule_write(self, due: float | None) -> None:
+        """(Re)schedule the postponed write at the monotonic time due, None
+        only cancels it.
+        """
+        self._cancel_pending()
+        if due is None:
+            return
+
+        self._pending_due = due
+        self._unsub_pending = async_call_later(
+            self.hass, max(due - time.monotonic(), 0), self._write_pending
+        )
+
+    def _max_due(self) -> float | None:
+        """Moment the state has to be written again, also if it is flat."""
+        if self._sensor_filter is None:
+            return None
+
+        max_interval = self._sensor_filter[CONF_MAX_INTERVAL]
+        if max_interval is None:
+            return None
+
+        return self._last_write + max_interval.total_seconds()
+
+    def _written(self) -> None:
+        """The state is written, the max interval starts again."""
+        self._last_write = time.monotonic()
+        self._schedule_write(self._max_due())
+
+    def _filter_state(self, state: Any, force: bool = False) -> bool:
+        """Apply the deadband and min/max interval of the sensor filter.
+        Returns True if the state should be written now, otherwise the
+        state is postponed to the moment it is allowed to be written.
+        """
+
+        if self._sensor_filter is None:
+            return True
+
+        # Going from/to unknown/unavailable is always written
+        if (
+            force
+            or not isinstance(state, (int, float))
+            or not isinstance(self._state, (int, float))
+        ):
+            return True
+
+        now = time.monotonic()
+        max_due = self._max_due()
+        if max_due is not None and now >= max_due:
+            return True
+
+        if abs(state - self._state) < self._sensor_filter[CONF_DEADBAND]:
+            # Inside the deadband, the max interval write gives the latest state
+            return False
+
+        due = self._last_write + self._sensor_filter[CONF_MIN_INTERVAL].total_seconds()
+        if now >= due:
+            return True
+
+        # Postpone the write until the min interval expires
+        if self._unsub_pending is None or due < self._pending_due:
+            self._schedule_write(due)
+
+        return False
+
+    @callback
+    def _write_pending(self, _now: datetime) -> None:
+        """Write the postponed state."""
+        self._unsub_pending = None
+        self._state = self._pending_state
+        self.async_write_ha_state()
+        self._written()
+
     def event_callback(self, name="", remove=False) -> None:
         """Callback for update of container information."""
 
@@ -415,6 +581,10 @@ class DockerContainerSensor(SensorEntity):
             self.entity_description.key,
         )
 
+        # Unavailable while the Docker daemon is disconnected
+        available_changed = self._attr_available != self._container.available
+        self._attr_available = self._container.available
+
         stats = {}
 
         try:
@@ -467,11 +637,37 @@ class DockerContainerSensor(SensorEntity):
                     else:
                         state = stats.get(self.entity_description.key)
 
-        if (
-            state != self._state
-            or self.entity_description.key == CONTAINER_INFO_ALLINONE
+        # The state sensors show the effective poll interval and failures
+        attr_changed = False
+        if self.entity_description.key in [
+            CONTAINER_INFO_ALLINONE,
+            CONTAINER_INFO_STATE,
+        ]:
+            for attr in [ATTR_POLL_INTERVAL, ATTR_POLL_FAILURES]:
+                value = self._container.get_info().get(attr)
+                if self._attr_extra_state_attributes.get(attr) != value:
+                    self._attr_extra_state_attributes[attr] = value
+                    attr_changed = True
+
+        # A postponed or max interval write gives the latest state
+        self._pending_state = state
+
+        # Back at the written value, a postponed write is not needed anymore
+        if state == self._state and self._unsub_pending is not None:
+            max_due = self._max_due()
+            if max_due is None or self._pending_due < max_due:
+                self._schedule_write(max_due)
+
+        if available_changed or (
+            (
+                state != self._state
+                or attr_changed
+                or self.entity_description.key == CONTAINER_INFO_ALLINONE
+            )
+            and self._filter_state(state, attr_changed)
         ):
             self._state = state
+            self._written()
 
             try:
                 self.schedule_update_ha_state()
@@ -6,12 +6,17 @@ import re
 from typing import Any
 
 import voluptuous as vol
-from custom_components.monitor_docker.helpers import DockerAPI, DockerContainerAPI
+from custom_components.monitor_docker.helpers import (
+    DockerAPI,
+    DockerContainerAPI,
+    resolve_restart_target,
+)
 from homeassistant.components.switch import ENTITY_ID_FORMAT, SwitchEntity
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import slugify
@@ -28,10 +33,10 @@ from .const import (
     CONF_SWITCHENABLED,
     CONF_SWITCHNAME,
     CONFIG,
-    CONTAINER,
     CONTAINER_INFO_STATE,
     DOMAIN,
     SERVICE_RESTART,
+    SIGNAL_CONTAINERS_ADDED,
 )
 
 SERVICE_RESTART_SCHEMA = vol.Schema({ATTR_NAME: cv.string, ATTR_SERVER: cv.string})
@@ -51,36 +56,9 @@ async def async_setup_platform(
         cname = parm.data[ATTR_NAME]
         cserver = parm.data.get(ATTR_SERVER, None)
 
-        server_name = name
-        if cserver is not None:
-            if cserver not in hass.data[DOMAIN]:
-                _LOGGER.error("Server '%s' is not configured", cserver)
-                return
-            else:
-                server_name = cserver
-
-        server_config = hass.data[DOMAIN][server_name][CONFIG]
-        server_api = hass.data[DOMAIN][server_name][API]
-
-        if len(server_config[CONF_CONTAINERS]) == 0:
-            if server_api.get_container(cname):
-                await server_api.get_container(cname).restart()
-            else:
-                _LOGGER.error(
-                    "Service restart failed, container '%s' does not exist", cname
-                )
-        elif cname in server_config[CONF_CONTAINERS]:
-            _LOGGER.debug("Trying to restart container '%s'", cname)
-            if server_api.get_container(cname):
-                await server_api.get_container(cname).restart()
-            else:
-                _LOGGER.error(
-                    "Service restart failed, container '%s'does not exist", cname
-                )
-        else:
-            _LOGGER.error(
-                "Service restart failed, container '%s' is not configured", cname
-            )
+        container = resolve_restart_target(hass, cname, cserver)
+        if container is not None:
+            await container.restart()
 
     def find_rename(d: dict[str, str], item: str) -> str:
         for k in d:
@@ -109,53 +87,66 @@ async def async_setup_platform(
 
     _LOGGER.debug("[%s]: Setting up switch(es)", instance)
 
-    switches = []
-
-    # We support add/re-add of a container
-    if CONTAINER in discovery_info:
-        clist = [discovery_info[CONTAINER]]
-    else:
-        clist = api.list_containers()
+    @callback
+    def add_containers(clist: list[str]) -> None:
+        """Add the switches of a batch of containers."""
 
-    for cname in clist:
-        includeContainer = False
-        if cname in config[CONF_CONTAINERS] or not config[CONF_CONTAINERS]:
-            includeContainer = True
+        switches = []
 
-        if config[CONF_CONTAINERS_EXCLUDE] and cname in config[CONF_CONTAINERS_EXCLUDE]:
+        for cname in clist:
             includeContainer = False
+            if cname in config[CONF_CONTAINERS] or not config[CONF_CONTAINERS]:
+                includeContainer = True
 
-        if includeContainer:
             if (
-                config[CONF_SWITCHENABLED] == True
-                or cname in config[CONF_SWITCHENABLED]
+                config[CONF_CONTAINERS_EXCLUDE]
+                and cname in config[CONF_CONTAINERS_EXCLUDE]
             ):
-                _LOGGER.debug("[%s] %s: Adding component Switch", instance, cname)
-
-                # Only force rename of entityid is requested, to not break backwards compatibility
-                alias_entityid = cname
-                if config[CONF_RENAME_ENITITY]:
-                    alias_entityid = find_rename(config[CONF_RENAME], cname)
-
-                switches.append(
-                    DockerContainerSwitch(
-                        api.get_container(cname),
-                        instance=instance,
-                        prefix=prefix,
-                        cname=cname,
-                        alias_entityid=alias_entityid,
-                        alias_name=find_rename(config[CONF_RENAME], cname),
-                        name_format=config[CONF_SWITCHNAME],
+                includeContainer = False
+
+            if includeContainer:
+                if (
+                    config[CONF_SWITCHENABLED] == True
+                    or cname in config[CONF_SWITCHENABLED]
+                ):
+                    _LOGGER.debug("[%s] %s: Adding component Switch", instance, cname)
+
+                    # Only force rename of entityid is requested, to not break backwards compatibility
+                    alias_entityid = cname
+                    if config[CONF_RENAME_ENITITY]:
+                        alias_entityid = find_rename(config[CONF_RENAME], cname)
+
+                    switches.append(
+                        DockerContainerSwitch(
+                            api.get_container(cname),
+                            instance=instance,
+                            prefix=prefix,
+                            cname=cname,
+                            alias_entityid=alias_entityid,
+                            alias_name=find_rename(config[CONF_RENAME], cname),
+                            name_format=config[CONF_SWITCHNAME],
+                        )
+                    )
+                else:
+                    _LOGGER.debug(
+                        "[%s] %s: NOT Adding component Switch", instance, cname
                     )
-                )
-            else:
-                _LOGGER.debug("[%s] %s: NOT Adding component Switch", instance, cname)
 
-    if not switches:
-        _LOGGER.info("[%s]: No containers set-up", instance)
-        return False
+        if switches:
+            async_add_entities(switches, True)
 
-    async_add_entities(switches, True)
+    add_containers(list(api.list_containers()))
+
+    # Containers created later on are added in batches by the DockerAPI
+    api.register_dispatcher(
+        async_dispatcher_connect(
+            hass, SIGNAL_CONTAINERS_ADDED.format(instance), add_containers
+        )
+    )
+
+    # The service is shared by all instances and platforms, register it once
+    if hass.services.has_service(DOMAIN, SERVICE_RESTART):
+        return True
 
     # platform = entity_platform.current_platform.get()
     # platform.async_register_entity_service(SERVICE_RESTART, {}, "async_restart")
@@ -227,7 +218,9 @@ class DockerContainerSwitch(SwitchEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
-        self._container.register_callback(self.event_callback, "switch")
+        self._container.register_callback(
+            self.event_callback, "switch", [CONTAINER_INFO_STATE]
+        )
 
         # Call event callback for possible information available
         self.event_callback()
@@ -247,6 +240,10 @@ class DockerContainerSwitch(SwitchEntity):
 
         state = None
 
+        # Unavailable while the Docker daemon is disconnected
+        available_changed = self._attr_available != self._container.available
+        self._attr_available = self._container.available
+
         try:
             info = self._container.get_info()
         except Exception as err:
@@ -260,6 +257,6 @@ class DockerContainerSwitch(SwitchEntity):
             if info is not None:
                 state = info.get(CONTAINER_INFO_STATE) == "running"
 
-        if state is not self._state:
+        if state is not self._state or available_changed:
             self._state = state
             self.async_schedule_update_ha_state()
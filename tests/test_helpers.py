@@ -0,0 +1,177 @@
+"""Checks of the pure logic of the Docker API helpers: the mapping view of the
+container records, the net change of queued create/destroy events and the
+deduplication of the events replayed by a resumed event stream.
+
+Run from the repository root (requires the Home Assistant requirements):
+
+    python -m pytest tests
+"""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("aiodocker")
+
+from custom_components.monitor_docker import DOCKER_SCHEMA
+from custom_components.monitor_docker.const import (
+    CONTAINER_INFO_STATE,
+    CONTAINER_STATS_CPU_PERCENTAGE,
+    CONTAINER_STATS_MEMORY,
+)
+from custom_components.monitor_docker.helpers import (
+    ContainerInfo,
+    ContainerStats,
+    DockerAPI,
+)
+
+
+def docker_api() -> DockerAPI:
+    """A DockerAPI which is not connected, hass is not used by these checks."""
+    return DockerAPI(None, DOCKER_SCHEMA({"name": "Test"}))
+
+
+def event(action: str, cid: str, time_nano: int | None) -> dict:
+    result = {
+        "Type": "container",
+        "Action": action,
+        "id": cid,
+        "Actor": {"ID": cid, "Attributes": {"name": f"name-{cid}"}},
+    }
+    if time_nano is not None:
+        result["timeNano"] = time_nano
+    return result
+
+
+async def consume(api: DockerAPI, events: list[dict], resumed: bool) -> None:
+    """Run the events through _consume_events, like one subscription."""
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in events:
+        queue.put_nowait(item)
+    queue.put_nowait(None)
+
+    await api._consume_events(queue, time.time_ns(), resumed)
+
+
+#################################################################
+def test_record_mapping_view():
+    stats = ContainerStats()
+
+    # Unset values are None, get() gives the default like a missing key
+    assert stats[CONTAINER_STATS_CPU_PERCENTAGE] is None
+    assert stats.get(CONTAINER_STATS_CPU_PERCENTAGE, 0.0) == 0.0
+    assert stats.get("unknown", "default") == "default"
+
+    stats.cpu_percentage = 12.5
+    stats[CONTAINER_STATS_MEMORY] = 256.0
+    assert stats.memory == 256.0
+    assert stats.get(CONTAINER_STATS_CPU_PERCENTAGE) == 12.5
+
+    assert CONTAINER_STATS_MEMORY in stats
+    assert "unknown" not in stats
+    assert len(stats) == len(ContainerStats.KEYS)
+    assert list(stats) == list(stats.keys()) == list(ContainerStats.KEYS)
+
+    items = dict(stats.items())
+    assert items[CONTAINER_STATS_CPU_PERCENTAGE] == 12.5
+    assert items[CONTAINER_STATS_MEMORY] == 256.0
+    assert stats.values() == tuple(items.values())
+
+    with pytest.raises(KeyError):
+        stats["unknown"]
+
+
+def test_record_keys_are_separate():
+    info = ContainerInfo()
+    info.state = "running"
+
+    assert info[CONTAINER_INFO_STATE] == "running"
+    assert CONTAINER_INFO_STATE not in ContainerStats()
+
+
+#################################################################
+def test_queue_change_net():
+    async def run() -> dict[str, str]:
+        api = docker_api()
+
+        # Create and destroy cancel out
+        api._queue_change("a", "create")
+        api._queue_change("a", "destroy")
+
+        # Destroy and create is the same name, but a new container
+        api._queue_change("b", "destroy")
+        api._queue_change("b", "create")
+
+        api._queue_change("c", "create")
+        api._queue_change("d", "destroy")
+
+        # Duplicates do not change the pending change
+        api._queue_change("c", "create")
+        api._queue_change("d", "destroy")
+
+        api._tasks["changes"].cancel()
+        return dict(api._changes)
+
+    assert asyncio.run(run()) == {"b": "recreate", "c": "create", "d": "destroy"}
+
+
+#################################################################
+def test_events_same_timestamp():
+    async def run() -> int:
+        api = docker_api()
+        await consume(api, [event("start", "a", 100), event("start", "b", 100)], False)
+        return api._events_received
+
+    # Events at the same timestamp are all new
+    assert asyncio.run(run()) == 2
+
+
+def test_events_resume_boundary():
+    async def run() -> tuple[int, int]:
+        api = docker_api()
+        await consume(
+            api,
+            [
+                event("start", "a", 100),
+                event("start", "b", 200),
+                event("die", "c", 200),
+            ],
+            False,
+        )
+
+        # The since of the resume replays the events of the last timestamp
+        await consume(
+            api,
+            [
+                event("start", "b", 200),
+                event("die", "c", 200),
+                event("stop", "c", 200),
+                event("start", "d", 300),
+            ],
+            True,
+        )
+        return api._events_received, api._event_last
+
+    # Only the new stop of c and start of d are handled on the resume
+    assert asyncio.run(run()) == (5, 300)
+
+
+def test_events_without_timestamp():
+    async def run() -> tuple[int, int | None]:
+        api = docker_api()
+        await consume(
+            api,
+            [
+                event("start", "a", 100),
+                event("start", "b", None),
+                event("stop", "b", None),
+            ],
+            True,
+        )
+        return api._events_received, api._event_last
+
+    # Handled, but they do not move the resume point
+    assert asyncio.run(run()) == (3, 100)
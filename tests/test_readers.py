@@ -0,0 +1,126 @@
+"""Checks of the cgroup and procfs readers against a fake filesystem tree.
+
+Run from the repository root (requires the Home Assistant requirements):
+
+    python -m pytest tests
+"""
+
+import shutil
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("aiodocker")
+
+from custom_components.monitor_docker.helpers import CgroupStatsReader, ProcNetReader
+
+CONTAINER_ID = "0123456789abcdef" * 4
+
+CPU_STAT = """usage_usec 2500000
+user_usec 2000000
+system_usec 500000
+nr_periods 0
+"""
+
+MEMORY_STAT = """anon 104857600
+file 52428800
+inactive_file 20971520
+active_file 31457280
+"""
+
+NET_DEV = """Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo:     960      12    0    0    0     0          0         0      960      12    0    0    0     0       0          0
+  eth0: 1048576    1024    0    0    0     0          0         0   524288     512    0    0    0     0       0          0
+  eth1:    2048       4    0    0    0     0          0         0     4096       8    0    0    0     0       0          0
+"""
+
+MEMINFO = """MemTotal:       16384000 kB
+MemFree:         8192000 kB
+"""
+
+
+def cgroup_tree(path, memory_max: str = "1073741824\n") -> None:
+    """Write the cgroup v2 files of a container."""
+    path.mkdir(parents=True)
+    (path / "cpu.stat").write_text(CPU_STAT)
+    (path / "memory.current").write_text("209715200\n")
+    (path / "memory.stat").write_text(MEMORY_STAT)
+    (path / "memory.max").write_text(memory_max)
+
+
+@pytest.fixture
+def meminfo(tmp_path):
+    path = tmp_path / "meminfo"
+    path.write_text(MEMINFO)
+    return path
+
+
+def test_cgroup_systemd_driver(tmp_path, meminfo):
+    cgroup_tree(tmp_path / "system.slice" / f"docker-{CONTAINER_ID}.scope")
+    reader = CgroupStatsReader(str(tmp_path), str(meminfo))
+
+    raw = reader.read_stats(CONTAINER_ID)
+
+    assert raw["cpu_stats"]["cpu_usage"]["total_usage"] == 2500000 * 1000
+    assert raw["cpu_stats"]["online_cpus"] >= 1
+    assert raw["memory_stats"] == {
+        "usage": 209715200,
+        "limit": 1073741824,
+        "stats": {"inactive_file": 20971520},
+    }
+
+
+def test_cgroup_cgroupfs_driver(tmp_path, meminfo):
+    cgroup_tree(tmp_path / "docker" / CONTAINER_ID)
+    reader = CgroupStatsReader(str(tmp_path), str(meminfo))
+
+    assert reader.read_stats(CONTAINER_ID)["memory_stats"]["usage"] == 209715200
+
+
+def test_cgroup_no_memory_limit(tmp_path, meminfo):
+    cgroup_tree(tmp_path / "docker" / CONTAINER_ID, memory_max="max\n")
+    reader = CgroupStatsReader(str(tmp_path), str(meminfo))
+
+    # Docker reports the host memory as limit
+    assert reader.read_stats(CONTAINER_ID)["memory_stats"]["limit"] == 16384000 * 1024
+
+
+def test_cgroup_not_found(tmp_path, meminfo):
+    reader = CgroupStatsReader(str(tmp_path), str(meminfo))
+
+    assert reader.read_stats(CONTAINER_ID) is None
+
+
+def test_cgroup_removed(tmp_path, meminfo):
+    path = tmp_path / "docker" / CONTAINER_ID
+    cgroup_tree(path)
+    reader = CgroupStatsReader(str(tmp_path), str(meminfo))
+    assert reader.read_stats(CONTAINER_ID) is not None
+
+    # The container is stopped, the cgroup is gone
+    shutil.rmtree(path)
+    assert reader.read_stats(CONTAINER_ID) is None
+
+    # And found again after a start with the other driver
+    cgroup_tree(tmp_path / "system.slice" / f"docker-{CONTAINER_ID}.scope")
+    assert reader.read_stats(CONTAINER_ID) is not None
+
+
+def test_procnet_networks(tmp_path):
+    path = tmp_path / "1234" / "net"
+    path.mkdir(parents=True)
+    (path / "dev").write_text(NET_DEV)
+    reader = ProcNetReader(str(tmp_path))
+
+    # The loopback is not part of the Docker stats
+    assert reader.read_networks(1234) == {
+        "eth0": {"rx_bytes": 1048576, "tx_bytes": 524288},
+        "eth1": {"rx_bytes": 2048, "tx_bytes": 4096},
+    }
+
+
+def test_procnet_process_gone(tmp_path):
+    reader = ProcNetReader(str(tmp_path))
+
+    assert reader.read_networks(1234) is None
@@ -0,0 +1,173 @@
+"""Checks of the deadband, min interval and max interval filter of the
+container sensors. The timers of Home Assistant are recorded, not run.
+
+Run from the repository root (requires the Home Assistant requirements):
+
+    python -m pytest tests
+"""
+
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("aiodocker")
+
+from custom_components.monitor_docker import SENSOR_FILTER_SCHEMA, sensor
+from custom_components.monitor_docker.const import (
+    CONTAINER_MONITOR_LIST,
+    CONTAINER_STATS_CPU_PERCENTAGE,
+)
+
+
+class Timers:
+    """Record the async_call_later calls of the sensor."""
+
+    def __init__(self):
+        self.pending: list[list] = []
+
+    def call_later(self, _hass, delay: float, action):
+        timer = [delay, action, True]
+        self.pending.append(timer)
+
+        def cancel() -> None:
+            timer[2] = False
+
+        return cancel
+
+    def fire(self) -> None:
+        """Run the last timer, like it expired."""
+        timer = self.pending[-1]
+        assert timer[2]
+        timer[2] = False
+        timer[1](None)
+
+    def active(self) -> list[float]:
+        return [delay for delay, _action, active in self.pending if active]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(sensor.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def timers(monkeypatch):
+    timers = Timers()
+    monkeypatch.setattr(sensor, "async_call_later", timers.call_later)
+    return timers
+
+
+def cpu_sensor(**sensor_filter) -> sensor.DockerContainerSensor:
+    """A CPU sensor with a filter, which has written 10.0 just now."""
+
+    entity = sensor.DockerContainerSensor(
+        None,
+        instance="Test",
+        prefix="docker",
+        cname="test",
+        alias_entityid="test",
+        alias_name="test",
+        description=CONTAINER_MONITOR_LIST[CONTAINER_STATS_CPU_PERCENTAGE],
+        sensor_name_format="{name} {sensor}",
+        sensor_filter=SENSOR_FILTER_SCHEMA(sensor_filter),
+    )
+    entity.writes = []
+    entity.async_write_ha_state = lambda: entity.writes.append(entity._state)
+
+    entity._state = 10.0
+    entity._written()
+    return entity
+
+
+#################################################################
+def test_no_filter():
+    entity = cpu_sensor()
+    entity._sensor_filter = None
+
+    assert entity._filter_state(10.1)
+
+
+def test_deadband(clock, timers):
+    entity = cpu_sensor(deadband=1.0)
+
+    assert not entity._filter_state(10.5)
+    assert entity._filter_state(11.0)
+    assert entity._filter_state(9.0)
+
+    # Nothing is postponed without min/max interval
+    assert timers.active() == []
+
+
+def test_unknown_always_written(clock, timers):
+    entity = cpu_sensor(deadband=1.0, min_interval=timedelta(seconds=60))
+
+    assert entity._filter_state(None)
+    entity._state = None
+    assert entity._filter_state(10.0)
+
+
+def test_attribute_change_through_deadband(clock, timers):
+    entity = cpu_sensor(deadband=1.0, min_interval=timedelta(seconds=60))
+
+    assert entity._filter_state(10.5, force=True)
+
+
+def test_min_interval(clock, timers):
+    entity = cpu_sensor(deadband=1.0, min_interval=timedelta(seconds=60))
+
+    # Outside the deadband, but too soon: postponed to the min interval
+    clock[0] += 20
+    entity._pending_state = 15.0
+    assert not entity._filter_state(15.0)
+    assert timers.active() == [40]
+
+    # The postponed write gives the latest state
+    entity._pending_state = 16.0
+    timers.fire()
+    assert entity.writes == [16.0]
+
+    clock[0] += 60
+    assert entity._filter_state(20.0)
+
+
+def test_max_interval_flat_value(clock, timers):
+    entity = cpu_sensor(deadband=1.0, max_interval=timedelta(seconds=300))
+
+    # Every write plans the next max interval write, also for a flat value
+    assert timers.active() == [300]
+
+    clock[0] += 300
+    entity._pending_state = 10.0
+    timers.fire()
+    assert entity.writes == [10.0]
+    assert timers.active() == [300]
+
+
+def test_max_interval_inside_deadband(clock, timers):
+    entity = cpu_sensor(deadband=1.0, max_interval=timedelta(seconds=300))
+
+    clock[0] += 100
+    assert not entity._filter_state(10.5)
+
+    # Due, also inside the deadband
+    clock[0] += 200
+    assert entity._filter_state(10.5)
+
+
+def test_write_restarts_intervals(clock, timers):
+    entity = cpu_sensor(
+        deadband=1.0,
+        min_interval=timedelta(seconds=60),
+        max_interval=timedelta(seconds=300),
+    )
+
+    clock[0] += 100
+    entity._written()
+
+    # The min interval counts from the last write
+    clock[0] += 30
+    assert not entity._filter_state(15.0)
+    assert timers.active() == [30]